@@ -1,6 +1,8 @@
 from flask import Flask
 from app.core.config import Config
+from app.core.registry import registry, register_default_services
 from app.utils.logger import setup_logger
+import atexit
 import os
 
 def create_app():
@@ -12,7 +14,17 @@ def create_app():
     
     setup_logger()
     
+    register_default_services(registry)
+    app.extensions['registry'] = registry
+    atexit.register(shutdown_services)
+    
     from app.web.routes import main_bp
     app.register_blueprint(main_bp)
     
     return app
+
+def shutdown_services():
+    from app.ai.anthropic_client import close_shared_clients
+    
+    registry.shutdown()
+    close_shared_clients()
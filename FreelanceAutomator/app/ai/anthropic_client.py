@@ -1,79 +1,462 @@
-from anthropic import Anthropic
+import asyncio
+import json
+import threading
+import weakref
+from dataclasses import dataclass
+from anthropic import Anthropic, AsyncAnthropic
+from app.ai.generation_cache import GenerationCache, get_generation_cache, make_cache_key
 from app.core.config import Config
 from app.core.exceptions import AIGenerationError, ConfigurationError
+from app.utils.circuit_breaker import CircuitBreaker, get_circuit_breaker
 from app.utils.logger import get_logger
-from typing import Optional
+from app.utils.rate_limiter import get_rate_limiter, rate_limit_headers
+from app.utils.retry import RetryPolicy
+from typing import Optional, Dict, Any, Iterator, AsyncIterator, List, Union
 
 logger = get_logger(__name__)
 
+SystemPrompt = Union[str, List[Dict[str, Any]]]
+
+@dataclass
+class GenerationResult:
+    text: str
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    cached: bool = False
+
+_clients_lock = threading.Lock()
+_sync_clients: Dict[str, Anthropic] = {}
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, AsyncAnthropic]]" = weakref.WeakKeyDictionary()
+_orphaned_async_clients: List[AsyncAnthropic] = []
+
+def get_shared_client(api_key: str) -> Anthropic:
+    with _clients_lock:
+        client = _sync_clients.get(api_key)
+        if client is None:
+            client = Anthropic(
+                api_key=api_key,
+                base_url=Config.ANTHROPIC_BASE_URL or None,
+                timeout=Config.ANTHROPIC_TIMEOUT,
+                max_retries=Config.ANTHROPIC_SDK_MAX_RETRIES
+            )
+            _sync_clients[api_key] = client
+            logger.info("Anthropic client initialized successfully")
+        return client
+
+def get_shared_async_client(api_key: str) -> AsyncAnthropic:
+    loop = asyncio.get_running_loop()
+    
+    while _orphaned_async_clients:
+        loop.create_task(_aclose_quietly(_orphaned_async_clients.pop()))
+    
+    with _clients_lock:
+        loop_clients = _async_clients.setdefault(loop, {})
+        client = loop_clients.get(api_key)
+        if client is None:
+            client = AsyncAnthropic(
+                api_key=api_key,
+                base_url=Config.ANTHROPIC_BASE_URL or None,
+                timeout=Config.ANTHROPIC_TIMEOUT,
+                max_retries=Config.ANTHROPIC_SDK_MAX_RETRIES
+            )
+            loop_clients[api_key] = client
+            weakref.finalize(loop, _orphaned_async_clients.append, client)
+            logger.info("Async Anthropic client initialized successfully")
+        return client
+
+def get_anthropic_circuit_breaker() -> CircuitBreaker:
+    return get_circuit_breaker(
+        'anthropic',
+        failure_threshold=Config.ANTHROPIC_CIRCUIT_FAILURE_THRESHOLD,
+        recovery_timeout=Config.ANTHROPIC_CIRCUIT_RECOVERY_SECONDS
+    )
+
+def close_shared_clients() -> None:
+    with _clients_lock:
+        clients = list(_sync_clients.values())
+        _sync_clients.clear()
+        async_clients = [
+            (loop, client)
+            for loop, loop_clients in list(_async_clients.items())
+            for client in loop_clients.values()
+        ]
+        _async_clients.clear()
+    
+    while _orphaned_async_clients:
+        async_clients.append((None, _orphaned_async_clients.pop()))
+    
+    for client in clients:
+        client.close()
+    
+    for loop, client in async_clients:
+        _close_async_client(loop, client)
+    
+    logger.info(f"Closed {len(clients)} shared Anthropic clients and {len(async_clients)} async clients")
+
+async def aclose_shared_async_clients() -> None:
+    loop = asyncio.get_running_loop()
+    
+    with _clients_lock:
+        clients = list(_async_clients.pop(loop, {}).values())
+    
+    for client in clients:
+        await client.close()
+    
+    if clients:
+        logger.info(f"Closed {len(clients)} async Anthropic clients")
+
+async def _aclose_quietly(client: AsyncAnthropic) -> None:
+    try:
+        await client.close()
+    except Exception as e:
+        logger.warning(f"Error closing async Anthropic client: {e}")
+
+def _close_async_client(loop: Optional[asyncio.AbstractEventLoop], client: AsyncAnthropic) -> None:
+    try:
+        if loop is None or loop.is_closed():
+            asyncio.run(client.close())
+        elif not loop.is_running():
+            loop.run_until_complete(client.close())
+        elif asyncio._get_running_loop() is loop:
+            loop.create_task(client.close())
+        else:
+            asyncio.run_coroutine_threadsafe(client.close(), loop).result(timeout=5)
+    except Exception as e:
+        logger.warning(f"Error closing async Anthropic client: {e}")
+
 class AnthropicClient:
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache: Optional[GenerationCache] = None,
+        retry_policy: Optional[RetryPolicy] = None
+    ):
         self.api_key = api_key or Config.ANTHROPIC_API_KEY
+        self.cache = cache if cache is not None else get_generation_cache()
+        self.retry_policy = retry_policy or RetryPolicy.from_config()
+        self.circuit_breaker = get_anthropic_circuit_breaker()
+        self.rate_limiter = get_rate_limiter(
+            'anthropic',
+            requests_per_minute=Config.ANTHROPIC_REQUESTS_PER_MINUTE,
+            tokens_per_minute=Config.ANTHROPIC_INPUT_TOKENS_PER_MINUTE
+        )
         
         if not self.api_key:
             raise ConfigurationError("ANTHROPIC_API_KEY not provided")
         
         try:
-            self.client = Anthropic(api_key=self.api_key)
-            logger.info("Anthropic client initialized successfully")
+            self.client = get_shared_client(self.api_key)
         except Exception as e:
             logger.error(f"Failed to initialize Anthropic client: {e}")
             raise ConfigurationError(f"Failed to initialize Anthropic client: {e}")
     
+    @property
+    def async_client(self) -> AsyncAnthropic:
+        return get_shared_async_client(self.api_key)
+    
     def generate_text(
         self,
         prompt: str,
-        system_prompt: str = "",
+        system_prompt: SystemPrompt = "",
         model: str = "claude-3-5-sonnet-20241022",
         max_tokens: int = 1024,
-        temperature: float = 0.7
+        temperature: float = 0.7,
+        use_cache: bool = True,
+        cache_system: Optional[bool] = None
     ) -> str:
-        try:
-            logger.info(f"Generating text with model: {model}")
-            
-            kwargs = {
-                "model": model,
-                "max_tokens": max_tokens,
-                "temperature": temperature,
-                "messages": [{"role": "user", "content": prompt}]
-            }
-            
-            if system_prompt:
-                kwargs["system"] = system_prompt
+        return self.generate_message(
+            prompt,
+            system_prompt,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            use_cache=use_cache,
+            cache_system=cache_system
+        ).text
+    
+    async def generate_text_async(
+        self,
+        prompt: str,
+        system_prompt: SystemPrompt = "",
+        model: str = "claude-3-5-sonnet-20241022",
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        use_cache: bool = True,
+        cache_system: Optional[bool] = None
+    ) -> str:
+        result = await self.generate_message_async(
+            prompt,
+            system_prompt,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            use_cache=use_cache,
+            cache_system=cache_system
+        )
+        return result.text
+    
+    def generate_message(
+        self,
+        prompt: str,
+        system_prompt: SystemPrompt = "",
+        model: str = "claude-3-5-sonnet-20241022",
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        use_cache: bool = True,
+        cache_system: Optional[bool] = None
+    ) -> GenerationResult:
+        cache_key = self._cache_key(prompt, system_prompt, model, max_tokens, temperature)
+        if use_cache and cache_key:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Generation cache hit for model: {model}")
+                return GenerationResult(text=cached, cached=True)
+        
+        with self.circuit_breaker.guard():
+            try:
+                logger.info(f"Generating text with model: {model}")
+                
+                kwargs = self.build_request(prompt, system_prompt, model, max_tokens, temperature, cache_system)
+                self.rate_limiter.acquire(tokens=self._estimate_input_tokens(prompt, system_prompt))
+                raw_response = self.client.messages.with_raw_response.create(**kwargs)
+                self.rate_limiter.update_from_headers(raw_response.headers)
+                
+                result = self._build_result(raw_response.parse())
             
-            message = self.client.messages.create(**kwargs)
+            except Exception as e:
+                self.rate_limiter.update_from_headers(rate_limit_headers(e))
+                logger.error(f"Error generating text: {e}")
+                raise AIGenerationError(f"Failed to generate text: {e}") from e
+        
+        if cache_key:
+            self.cache.set(cache_key, result.text)
+        
+        return result
+    
+    async def generate_message_async(
+        self,
+        prompt: str,
+        system_prompt: SystemPrompt = "",
+        model: str = "claude-3-5-sonnet-20241022",
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        use_cache: bool = True,
+        cache_system: Optional[bool] = None
+    ) -> GenerationResult:
+        cache_key = self._cache_key(prompt, system_prompt, model, max_tokens, temperature)
+        if use_cache and cache_key:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Generation cache hit for model: {model}")
+                return GenerationResult(text=cached, cached=True)
+        
+        with self.circuit_breaker.guard():
+            try:
+                logger.info(f"Generating text asynchronously with model: {model}")
+                
+                kwargs = self.build_request(prompt, system_prompt, model, max_tokens, temperature, cache_system)
+                await self.rate_limiter.acquire_async(tokens=self._estimate_input_tokens(prompt, system_prompt))
+                raw_response = await self.async_client.messages.with_raw_response.create(**kwargs)
+                self.rate_limiter.update_from_headers(raw_response.headers)
+                
+                result = self._build_result(await raw_response.parse())
             
-            if not message.content:
-                raise AIGenerationError("Empty response from AI")
+            except Exception as e:
+                self.rate_limiter.update_from_headers(rate_limit_headers(e))
+                logger.error(f"Error generating text: {e}")
+                raise AIGenerationError(f"Failed to generate text: {e}") from e
+        
+        if cache_key:
+            self.cache.set(cache_key, result.text)
+        
+        return result
+    
+    def stream_text(
+        self,
+        prompt: str,
+        system_prompt: SystemPrompt = "",
+        model: str = "claude-3-5-sonnet-20241022",
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        cache_system: Optional[bool] = None
+    ) -> Iterator[str]:
+        with self.circuit_breaker.guard():
+            try:
+                logger.info(f"Streaming text with model: {model}")
+                
+                kwargs = self.build_request(prompt, system_prompt, model, max_tokens, temperature, cache_system)
+                self.rate_limiter.acquire(tokens=self._estimate_input_tokens(prompt, system_prompt))
+                with self.client.messages.stream(**kwargs) as stream:
+                    for text in stream.text_stream:
+                        yield text
             
-            text_content = next((block.text for block in message.content if hasattr(block, 'text')), None)
-            if not text_content:
-                raise AIGenerationError("No text content in response")
+            except Exception as e:
+                self.rate_limiter.update_from_headers(rate_limit_headers(e))
+                logger.error(f"Error streaming text: {e}")
+                raise AIGenerationError(f"Failed to stream text: {e}") from e
+    
+    async def stream_text_async(
+        self,
+        prompt: str,
+        system_prompt: SystemPrompt = "",
+        model: str = "claude-3-5-sonnet-20241022",
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        cache_system: Optional[bool] = None
+    ) -> AsyncIterator[str]:
+        with self.circuit_breaker.guard():
+            try:
+                logger.info(f"Streaming text asynchronously with model: {model}")
+                
+                kwargs = self.build_request(prompt, system_prompt, model, max_tokens, temperature, cache_system)
+                await self.rate_limiter.acquire_async(tokens=self._estimate_input_tokens(prompt, system_prompt))
+                async with self.async_client.messages.stream(**kwargs) as stream:
+                    async for text in stream.text_stream:
+                        yield text
             
-            logger.info(f"Successfully generated text ({len(text_content)} chars)")
+            except Exception as e:
+                self.rate_limiter.update_from_headers(rate_limit_headers(e))
+                logger.error(f"Error streaming text: {e}")
+                raise AIGenerationError(f"Failed to stream text: {e}") from e
+    
+    def create_message_batch(self, requests: List[Dict[str, Any]]) -> Any:
+        return self._batches_request('create', requests=requests)
+    
+    def retrieve_message_batch(self, batch_id: str) -> Any:
+        return self.retry_policy.call(self._batches_request, 'retrieve', batch_id)
+    
+    def message_batch_results(self, batch_id: str) -> List[Any]:
+        return self.retry_policy.call(self._batch_results, batch_id)
+    
+    def _batches_request(self, method: str, *args, **kwargs) -> Any:
+        with self.circuit_breaker.guard():
+            try:
+                self.rate_limiter.acquire()
+                raw_response = getattr(self.client.messages.batches.with_raw_response, method)(*args, **kwargs)
+                self.rate_limiter.update_from_headers(raw_response.headers)
+                return raw_response.parse()
             
-            return text_content
+            except Exception as e:
+                self.rate_limiter.update_from_headers(rate_limit_headers(e))
+                logger.error(f"Error in message batch {method}: {e}")
+                raise AIGenerationError(f"Message batch {method} failed: {e}") from e
+    
+    def _batch_results(self, batch_id: str) -> List[Any]:
+        with self.circuit_breaker.guard():
+            try:
+                self.rate_limiter.acquire()
+                return list(self.client.messages.batches.results(batch_id))
             
-        except Exception as e:
-            logger.error(f"Error generating text: {e}")
-            raise AIGenerationError(f"Failed to generate text: {e}")
+            except Exception as e:
+                self.rate_limiter.update_from_headers(rate_limit_headers(e))
+                logger.error(f"Error fetching results for message batch {batch_id}: {e}")
+                raise AIGenerationError(f"Failed to fetch message batch results: {e}") from e
     
     def generate_with_retry(
         self,
         prompt: str,
-        system_prompt: str = "",
-        max_retries: int = 3,
+        system_prompt: SystemPrompt = "",
+        max_retries: Optional[int] = None,
         **kwargs
     ) -> str:
-        last_error = None
+        policy = self.retry_policy if max_retries is None else self.retry_policy.with_attempts(max_retries)
+        return policy.call(self.generate_text, prompt, system_prompt, **kwargs)
+    
+    async def generate_with_retry_async(
+        self,
+        prompt: str,
+        system_prompt: SystemPrompt = "",
+        max_retries: Optional[int] = None,
+        **kwargs
+    ) -> str:
+        policy = self.retry_policy if max_retries is None else self.retry_policy.with_attempts(max_retries)
+        return await policy.call_async(self.generate_text_async, prompt, system_prompt, **kwargs)
+    
+    def _estimate_input_tokens(self, prompt: str, system_prompt: SystemPrompt) -> int:
+        system_text = system_prompt if isinstance(system_prompt, str) else json.dumps(system_prompt)
+        return (len(prompt) + len(system_text)) // 4 + 1
+    
+    def _estimate_tokens(self, text: str) -> int:
+        return len(text) // 4 + 1
+    
+    def _cache_key(
+        self,
+        prompt: str,
+        system_prompt: SystemPrompt,
+        model: str,
+        max_tokens: int,
+        temperature: float
+    ) -> Optional[str]:
+        if self.cache is None:
+            return None
+        return make_cache_key(model, system_prompt, prompt, max_tokens, temperature)
+    
+    def build_request(
+        self,
+        prompt: str,
+        system_prompt: SystemPrompt,
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        cache_system: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        kwargs = {
+            "model": model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "messages": [{"role": "user", "content": prompt}]
+        }
         
-        for attempt in range(max_retries):
-            try:
-                return self.generate_text(prompt, system_prompt, **kwargs)
-            except Exception as e:
-                last_error = e
-                logger.warning(f"Attempt {attempt + 1}/{max_retries} failed: {e}")
-                if attempt < max_retries - 1:
-                    continue
+        if system_prompt:
+            kwargs["system"] = self._build_system(system_prompt, cache_system)
+        
+        return kwargs
+    
+    def _build_system(self, system_prompt: SystemPrompt, cache_system: Optional[bool]) -> SystemPrompt:
+        if cache_system is None:
+            cache_system = Config.ANTHROPIC_PROMPT_CACHING
+        
+        if not isinstance(system_prompt, str) or not cache_system:
+            return system_prompt
+        if self._estimate_tokens(system_prompt) < Config.ANTHROPIC_PROMPT_CACHE_MIN_TOKENS:
+            return system_prompt
+        
+        return [{
+            "type": "text",
+            "text": system_prompt,
+            "cache_control": {"type": "ephemeral"}
+        }]
+    
+    def _build_result(self, message: Any) -> GenerationResult:
+        text_content = self.extract_text(message)
+        
+        usage = getattr(message, 'usage', None)
+        result = GenerationResult(
+            text=text_content,
+            input_tokens=getattr(usage, 'input_tokens', 0) or 0,
+            output_tokens=getattr(usage, 'output_tokens', 0) or 0,
+            cache_creation_input_tokens=getattr(usage, 'cache_creation_input_tokens', 0) or 0,
+            cache_read_input_tokens=getattr(usage, 'cache_read_input_tokens', 0) or 0
+        )
+        
+        if result.cache_read_input_tokens or result.cache_creation_input_tokens:
+            logger.info(
+                f"Prompt cache: {result.cache_read_input_tokens} tokens read, "
+                f"{result.cache_creation_input_tokens} tokens written"
+            )
+        
+        return result
+    
+    def extract_text(self, message: Any) -> str:
+        if not message.content:
+            raise AIGenerationError("Empty response from AI")
+        
+        text_content = next((block.text for block in message.content if hasattr(block, 'text')), None)
+        if not text_content:
+            raise AIGenerationError("No text content in response")
+        
+        logger.info(f"Successfully generated text ({len(text_content)} chars)")
         
-        raise AIGenerationError(f"Failed after {max_retries} attempts: {last_error}")
+        return text_content
@@ -1,5 +1,6 @@
 from app.ai.base_generator import BaseContentGenerator
 from app.ai.prompt_templates import reviews, comments, posts
+from app.core.registry import registry
 from app.utils.logger import get_logger
 from typing import Optional, List
 
@@ -18,7 +19,7 @@ class ReviewGenerator(BaseContentGenerator):
         system_prompt = reviews.REVIEW_SYSTEM_PROMPT
         user_prompt = reviews.get_review_prompt(job_description, requirements, tone)
         
-        generated_review = self.client.generate_text(
+        generated_review = self.client.generate_with_retry(
             prompt=user_prompt,
             system_prompt=system_prompt,
             **kwargs
@@ -38,7 +39,7 @@ class ReviewGenerator(BaseContentGenerator):
         system_prompt = reviews.REVIEW_SYSTEM_PROMPT
         user_prompt = reviews.get_product_review_prompt(product_name, rating, key_points)
         
-        generated_review = self.client.generate_text(
+        generated_review = self.client.generate_with_retry(
             prompt=user_prompt,
             system_prompt=system_prompt,
             **kwargs
@@ -59,7 +60,7 @@ class CommentGenerator(BaseContentGenerator):
         system_prompt = comments.COMMENT_SYSTEM_PROMPT
         user_prompt = comments.get_comment_prompt(topic, context, length)
         
-        generated_comment = self.client.generate_text(
+        generated_comment = self.client.generate_with_retry(
             prompt=user_prompt,
             system_prompt=system_prompt,
             **kwargs
@@ -80,7 +81,7 @@ class PostGenerator(BaseContentGenerator):
         system_prompt = posts.POST_SYSTEM_PROMPT
         user_prompt = posts.get_post_prompt(topic, platform, target_audience)
         
-        generated_post = self.client.generate_text(
+        generated_post = self.client.generate_with_retry(
             prompt=user_prompt,
             system_prompt=system_prompt,
             **kwargs
@@ -102,4 +103,4 @@ class ContentGeneratorFactory:
         if not generator_class:
             raise ValueError(f"Unknown content type: {content_type}")
         
-        return generator_class()
+        return registry.get_or_create(f"generator:{generator_class.__name__}", generator_class)
@@ -0,0 +1,262 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+from app.core.config import Config
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+def make_cache_key(
+    model: str,
+    system_prompt: Any,
+    prompt: str,
+    max_tokens: int,
+    temperature: float
+) -> str:
+    payload = json.dumps(
+        [model, system_prompt, prompt, max_tokens, temperature],
+        ensure_ascii=False,
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+CacheEntry = Tuple[str, Optional[float]]
+
+class GenerationCache(ABC):
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[str]:
+        entry = self.get_entry(key)
+        return entry[0] if entry is not None else None
+    
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        entry = self._get(key)
+        with self._stats_lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return entry
+    
+    def set(self, key: str, value: str, ttl_seconds: Optional[float] = None) -> None:
+        self._set(key, value, ttl_seconds)
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self)}
+    
+    @abstractmethod
+    def _get(self, key: str) -> Optional[CacheEntry]:
+        pass
+    
+    @abstractmethod
+    def _set(self, key: str, value: str, ttl_seconds: Optional[float] = None) -> None:
+        pass
+    
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+    
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+class MemoryGenerationCache(GenerationCache):
+    def __init__(self, max_entries: int = 1000, ttl_seconds: Optional[float] = None):
+        super().__init__()
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def _get(self, key: str) -> Optional[CacheEntry]:
+        now = time.monotonic()
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            
+            value, expires_at = entry
+            if expires_at is not None and expires_at < now:
+                del self._entries[key]
+                return None
+            
+            self._entries.move_to_end(key)
+            return value, expires_at - now if expires_at is not None else None
+    
+    def _set(self, key: str, value: str, ttl_seconds: Optional[float] = None) -> None:
+        ttl = self.ttl_seconds or None
+        if ttl_seconds is not None:
+            ttl = ttl_seconds if ttl is None else min(ttl, ttl_seconds)
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+class SQLiteGenerationCache(GenerationCache):
+    def __init__(self, path: str, max_entries: int = 50000, ttl_seconds: Optional[float] = None):
+        super().__init__()
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS generation_cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_generation_cache_accessed_at "
+            "ON generation_cache (accessed_at)"
+        )
+    
+    def _get(self, key: str) -> Optional[CacheEntry]:
+        now = time.time()
+        
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM generation_cache WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            
+            value, created_at = row
+            if self.ttl_seconds and created_at + self.ttl_seconds < now:
+                self._conn.execute("DELETE FROM generation_cache WHERE key = ?", (key,))
+                return None
+            
+            self._conn.execute(
+                "UPDATE generation_cache SET accessed_at = ? WHERE key = ?",
+                (now, key)
+            )
+            return value, created_at + self.ttl_seconds - now if self.ttl_seconds else None
+    
+    def _set(self, key: str, value: str, ttl_seconds: Optional[float] = None) -> None:
+        now = time.time()
+        created_at = now
+        if self.ttl_seconds and ttl_seconds is not None:
+            created_at -= max(self.ttl_seconds - ttl_seconds, 0)
+        
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO generation_cache (key, value, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, created_at, now)
+            )
+            self._evict(now)
+    
+    def _evict(self, now: float) -> None:
+        if self.ttl_seconds:
+            self._conn.execute(
+                "DELETE FROM generation_cache WHERE created_at < ?",
+                (now - self.ttl_seconds,)
+            )
+        
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM generation_cache").fetchone()
+        if count > self.max_entries:
+            self._conn.execute(
+                "DELETE FROM generation_cache WHERE key IN ("
+                "SELECT key FROM generation_cache ORDER BY accessed_at LIMIT ?)",
+                (count - self.max_entries,)
+            )
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM generation_cache")
+    
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM generation_cache").fetchone()
+        return count
+
+class TieredGenerationCache(GenerationCache):
+    def __init__(self, tiers: List[GenerationCache]):
+        super().__init__()
+        self.tiers = tiers
+    
+    def _get(self, key: str) -> Optional[CacheEntry]:
+        for index, tier in enumerate(self.tiers):
+            entry = tier.get_entry(key)
+            if entry is not None:
+                for upper in self.tiers[:index]:
+                    upper.set(key, *entry)
+                return entry
+        return None
+    
+    def _set(self, key: str, value: str, ttl_seconds: Optional[float] = None) -> None:
+        for tier in self.tiers:
+            tier.set(key, value, ttl_seconds)
+    
+    def clear(self) -> None:
+        for tier in self.tiers:
+            tier.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        stats['tiers'] = [
+            {'type': type(tier).__name__, **tier.stats()}
+            for tier in self.tiers
+        ]
+        return stats
+    
+    def __len__(self) -> int:
+        return len(self.tiers[0]) if self.tiers else 0
+
+_cache_lock = threading.Lock()
+_generation_cache: Optional[GenerationCache] = None
+
+def get_generation_cache() -> Optional[GenerationCache]:
+    global _generation_cache
+    
+    if not Config.GENERATION_CACHE_ENABLED:
+        return None
+    
+    with _cache_lock:
+        if _generation_cache is None:
+            ttl = Config.GENERATION_CACHE_TTL_SECONDS or None
+            tiers: List[GenerationCache] = [
+                MemoryGenerationCache(Config.GENERATION_CACHE_MAX_ENTRIES, ttl)
+            ]
+            if Config.GENERATION_CACHE_PATH:
+                try:
+                    tiers.append(SQLiteGenerationCache(
+                        Config.GENERATION_CACHE_PATH,
+                        Config.GENERATION_CACHE_DISK_MAX_ENTRIES,
+                        ttl
+                    ))
+                except sqlite3.Error as e:
+                    logger.warning(f"SQLite generation cache unavailable: {e}")
+            _generation_cache = TieredGenerationCache(tiers)
+            logger.info(f"Generation cache initialized with {len(tiers)} tiers")
+        return _generation_cache
@@ -1,12 +1,14 @@
 from app.ai.anthropic_client import AnthropicClient
 from app.utils.logger import get_logger
-from typing import Optional, Dict
+from typing import Optional, Dict, Any
 
 logger = get_logger(__name__)
 
 class ProposalGenerator:
-    def __init__(self):
-        self.client = AnthropicClient()
+    model = "claude-3-5-sonnet-20241022"
+    
+    def __init__(self, anthropic_client: AnthropicClient = None):
+        self.client = anthropic_client or AnthropicClient()
     
     def generate_proposal(
         self,
@@ -18,22 +20,15 @@ class ProposalGenerator:
     ) -> str:
         logger.info(f"Generating proposal for job: {job_title}")
         
-        system_prompt = self._get_system_prompt()
-        user_prompt = self._build_user_prompt(
+        request = self.build_request(
             job_title,
             job_description,
-            freelancer_profile,
-            budget
+            freelancer_profile=freelancer_profile,
+            budget=budget
         )
         
         try:
-            proposal = self.client.generate_text(
-                prompt=user_prompt,
-                system_prompt=system_prompt,
-                max_tokens=1500,
-                temperature=0.7,
-                **kwargs
-            )
+            proposal = self.client.generate_with_retry(**request, **kwargs)
             
             return self._clean_proposal(proposal)
         except Exception as e:
@@ -48,10 +43,64 @@ class ProposalGenerator:
     ) -> str:
         logger.info(f"Generating short proposal for: {job_title}")
         
-        system_prompt = """Ты профессиональный фрилансер, который пишет короткие и эффективные предложения для заказов.
-        Твоя задача - создать краткое, но убедительное предложение (cover letter) объемом 2-3 предложения."""
+        request = self.build_request(job_title, job_description, proposal_type='short')
         
-        user_prompt = f"""Задание: {job_title}
+        try:
+            proposal = self.client.generate_with_retry(**request, **kwargs)
+            
+            return self._clean_proposal(proposal)
+        except Exception as e:
+            logger.error(f"Error generating short proposal: {e}")
+            raise
+    
+    def build_request(
+        self,
+        job_title: str,
+        job_description: str,
+        proposal_type: str = "standard",
+        freelancer_profile: Optional[Dict] = None,
+        budget: Optional[float] = None
+    ) -> Dict[str, Any]:
+        if proposal_type == 'short':
+            return {
+                'prompt': self._build_short_user_prompt(job_title, job_description),
+                'system_prompt': self._get_short_system_prompt(),
+                'max_tokens': 300,
+                'temperature': 0.6
+            }
+        
+        return {
+            'prompt': self._build_user_prompt(job_title, job_description, freelancer_profile, budget),
+            'system_prompt': self._get_system_prompt(),
+            'max_tokens': 1500,
+            'temperature': 0.7
+        }
+    
+    def build_batch_params(
+        self,
+        job_title: str,
+        job_description: str,
+        proposal_type: str = "standard",
+        budget: Optional[float] = None
+    ) -> Dict[str, Any]:
+        request = self.build_request(job_title, job_description, proposal_type=proposal_type, budget=budget)
+        return self.client.build_request(
+            request['prompt'],
+            request['system_prompt'],
+            model=self.model,
+            max_tokens=request['max_tokens'],
+            temperature=request['temperature']
+        )
+    
+    def parse_batch_message(self, message: Any) -> str:
+        return self._clean_proposal(self.client.extract_text(message))
+    
+    def _get_short_system_prompt(self) -> str:
+        return """Ты профессиональный фрилансер, который пишет короткие и эффективные предложения для заказов.
+        Твоя задача - создать краткое, но убедительное предложение (cover letter) объемом 2-3 предложения."""
+    
+    def _build_short_user_prompt(self, job_title: str, job_description: str) -> str:
+        return f"""Задание: {job_title}
 
 Описание: {job_description}
 
@@ -61,20 +110,6 @@ class ProposalGenerator:
 3. Выражает готовность начать работу
 
 Напиши только текст предложения, без дополнительных комментариев."""
-        
-        try:
-            proposal = self.client.generate_text(
-                prompt=user_prompt,
-                system_prompt=system_prompt,
-                max_tokens=300,
-                temperature=0.6,
-                **kwargs
-            )
-            
-            return self._clean_proposal(proposal)
-        except Exception as e:
-            logger.error(f"Error generating short proposal: {e}")
-            raise
     
     def _get_system_prompt(self) -> str:
         return """Ты опытный фрилансер с многолетним стажем работы на международных платформах.
@@ -8,8 +8,44 @@ class Config:
     DEBUG = os.getenv('DEBUG', 'True').lower() == 'true'
     
     ANTHROPIC_API_KEY = os.getenv('ANTHROPIC_API_KEY', '')
+    ANTHROPIC_BASE_URL = os.getenv('ANTHROPIC_BASE_URL', '')
+    ANTHROPIC_TIMEOUT = float(os.getenv('ANTHROPIC_TIMEOUT', 60))
+    ANTHROPIC_SDK_MAX_RETRIES = int(os.getenv('ANTHROPIC_SDK_MAX_RETRIES', 0))
+    ANTHROPIC_REQUESTS_PER_MINUTE = float(os.getenv('ANTHROPIC_REQUESTS_PER_MINUTE', 50))
+    ANTHROPIC_INPUT_TOKENS_PER_MINUTE = float(os.getenv('ANTHROPIC_INPUT_TOKENS_PER_MINUTE', 40000))
+    ANTHROPIC_PROMPT_CACHING = os.getenv('ANTHROPIC_PROMPT_CACHING', 'True').lower() == 'true'
+    ANTHROPIC_PROMPT_CACHE_MIN_TOKENS = int(os.getenv('ANTHROPIC_PROMPT_CACHE_MIN_TOKENS', 1024))
+    
+    RETRY_MAX_ATTEMPTS = int(os.getenv('RETRY_MAX_ATTEMPTS', 4))
+    RETRY_BASE_DELAY = float(os.getenv('RETRY_BASE_DELAY', 1))
+    RETRY_MAX_DELAY = float(os.getenv('RETRY_MAX_DELAY', 30))
+    RETRY_DEADLINE_SECONDS = float(os.getenv('RETRY_DEADLINE_SECONDS', 120))
+    
+    ANTHROPIC_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv('ANTHROPIC_CIRCUIT_FAILURE_THRESHOLD', 5))
+    ANTHROPIC_CIRCUIT_RECOVERY_SECONDS = float(os.getenv('ANTHROPIC_CIRCUIT_RECOVERY_SECONDS', 60))
+    UPWORK_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv('UPWORK_CIRCUIT_FAILURE_THRESHOLD', 3))
+    UPWORK_CIRCUIT_RECOVERY_SECONDS = float(os.getenv('UPWORK_CIRCUIT_RECOVERY_SECONDS', 300))
+    
+    GENERATION_CACHE_ENABLED = os.getenv('GENERATION_CACHE_ENABLED', 'True').lower() == 'true'
+    GENERATION_CACHE_MAX_ENTRIES = int(os.getenv('GENERATION_CACHE_MAX_ENTRIES', 1000))
+    GENERATION_CACHE_DISK_MAX_ENTRIES = int(os.getenv('GENERATION_CACHE_DISK_MAX_ENTRIES', 50000))
+    GENERATION_CACHE_TTL_SECONDS = int(os.getenv('GENERATION_CACHE_TTL_SECONDS', 86400))
+    GENERATION_CACHE_PATH = os.getenv('GENERATION_CACHE_PATH', 'generation_cache.db')
     
     DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///freelance_assistant.db')
+    DATABASE_AUTO_MIGRATE = os.getenv('DATABASE_AUTO_MIGRATE', 'True').lower() == 'true'
+    DATABASE_ECHO = os.getenv('DATABASE_ECHO', 'False').lower() == 'true'
+    DATABASE_POOL_SIZE = int(os.getenv('DATABASE_POOL_SIZE', 10))
+    DATABASE_MAX_OVERFLOW = int(os.getenv('DATABASE_MAX_OVERFLOW', 20))
+    DATABASE_POOL_TIMEOUT = float(os.getenv('DATABASE_POOL_TIMEOUT', 30))
+    DATABASE_POOL_RECYCLE = int(os.getenv('DATABASE_POOL_RECYCLE', 1800))
+    DATABASE_POOL_PRE_PING = os.getenv('DATABASE_POOL_PRE_PING', 'True').lower() == 'true'
+    SQLITE_JOURNAL_MODE = os.getenv('SQLITE_JOURNAL_MODE', 'WAL')
+    SQLITE_SYNCHRONOUS = os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL')
+    SQLITE_BUSY_TIMEOUT_MS = int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', 5000))
+    SQLITE_MMAP_SIZE = int(os.getenv('SQLITE_MMAP_SIZE', 268435456))
+    SQLITE_CACHE_SIZE_KB = int(os.getenv('SQLITE_CACHE_SIZE_KB', 65536))
+    SQLITE_FOREIGN_KEYS = os.getenv('SQLITE_FOREIGN_KEYS', 'False').lower() == 'true'
     
     UPWORK_CLIENT_ID = os.getenv('UPWORK_CLIENT_ID', '')
     UPWORK_CLIENT_SECRET = os.getenv('UPWORK_CLIENT_SECRET', '')
@@ -17,8 +53,35 @@ class Config:
     
     SCHEDULER_INTERVAL_MINUTES = int(os.getenv('SCHEDULER_INTERVAL_MINUTES', 30))
     
+    FEED_FETCH_CONCURRENCY = int(os.getenv('FEED_FETCH_CONCURRENCY', 4))
+    FEED_FETCH_TIMEOUT = float(os.getenv('FEED_FETCH_TIMEOUT', 15))
+    UPWORK_REQUESTS_PER_MINUTE = float(os.getenv('UPWORK_REQUESTS_PER_MINUTE', 30))
+    FEED_CACHE_ENABLED = os.getenv('FEED_CACHE_ENABLED', 'True').lower() == 'true'
+    TEXT_EXTRACTOR = os.getenv('TEXT_EXTRACTOR', 'auto')
+    TEXT_EXTRACTION_CACHE_SIZE = int(os.getenv('TEXT_EXTRACTION_CACHE_SIZE', 2048))
+    
+    CONTENT_GENERATION_WORKERS = int(os.getenv('CONTENT_GENERATION_WORKERS', 4))
+    CONTENT_GENERATION_BATCH_SIZE = int(os.getenv('CONTENT_GENERATION_BATCH_SIZE', 20))
+    JOB_LEASE_SECONDS = int(os.getenv('JOB_LEASE_SECONDS', 900))
+    
+    TASK_WORKER_CONCURRENCY = int(os.getenv('TASK_WORKER_CONCURRENCY', 4))
+    TASK_POLL_INTERVAL = float(os.getenv('TASK_POLL_INTERVAL', 1))
+    TASK_LEASE_SECONDS = int(os.getenv('TASK_LEASE_SECONDS', 900))
+    TASK_MAX_ATTEMPTS = int(os.getenv('TASK_MAX_ATTEMPTS', 1))
+    TASK_RETRY_DELAY_SECONDS = float(os.getenv('TASK_RETRY_DELAY_SECONDS', 30))
+    TASK_RETENTION_HOURS = int(os.getenv('TASK_RETENTION_HOURS', 24))
+    TASK_EMBEDDED_WORKER = os.getenv('TASK_EMBEDDED_WORKER', 'True').lower() == 'true'
+    
+    PROPOSAL_BATCH_ENABLED = os.getenv('PROPOSAL_BATCH_ENABLED', 'False').lower() == 'true'
+    PROPOSAL_BATCH_SIZE = int(os.getenv('PROPOSAL_BATCH_SIZE', 500))
+    PROPOSAL_BATCH_MIN_SIZE = int(os.getenv('PROPOSAL_BATCH_MIN_SIZE', 20))
+    PROPOSAL_BATCH_POLL_MINUTES = int(os.getenv('PROPOSAL_BATCH_POLL_MINUTES', 5))
+    
     MIN_JOB_PRICE = float(os.getenv('MIN_JOB_PRICE', 10))
     MAX_JOB_PRICE = float(os.getenv('MAX_JOB_PRICE', 500))
     TARGET_CATEGORIES = os.getenv('TARGET_CATEGORIES', 'review,comment,feedback,writing').split(',')
+    FILTER_COLUMNAR_THRESHOLD = int(os.getenv('FILTER_COLUMNAR_THRESHOLD', 10000))
+    
+    STATS_CACHE_SECONDS = float(os.getenv('STATS_CACHE_SECONDS', 5))
     
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
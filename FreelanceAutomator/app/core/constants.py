@@ -12,6 +12,13 @@ JOB_STATUS = {
     'SKIPPED': 'skipped'
 }
 
+TASK_STATUS = {
+    'QUEUED': 'queued',
+    'RUNNING': 'running',
+    'SUCCEEDED': 'succeeded',
+    'FAILED': 'failed'
+}
+
 PLATFORM_NAMES = {
     'UPWORK': 'upwork',
     'FREELANCER': 'fl_ru',
@@ -30,3 +37,23 @@ UPWORK_RSS_FEEDS = {
     'comments': 'https://www.upwork.com/ab/feed/jobs/rss?q=comment+writing',
     'feedback': 'https://www.upwork.com/ab/feed/jobs/rss?q=feedback+writing'
 }
+
+CATEGORY_KEYWORDS = [
+    ('review', ['review', 'отзыв']),
+    ('comment', ['comment', 'комментарий']),
+    ('feedback', ['feedback', 'обратная связь']),
+    ('post', ['post', 'пост', 'article', 'статья'])
+]
+
+DEFAULT_CATEGORY = 'writing'
+
+COMPLEXITY_KEYWORDS = [
+    (JOB_COMPLEXITY_LEVELS['EASY'], ['simple', 'quick', 'easy', 'short', 'brief']),
+    (JOB_COMPLEXITY_LEVELS['HARD'], ['complex', 'detailed', 'extensive', 'professional', 'expert'])
+]
+
+SIMPLE_TASK_KEYWORDS = [
+    'review', 'comment', 'feedback', 'rating',
+    'short', 'simple', 'quick', 'easy',
+    'write a', 'leave a', 'post a'
+]
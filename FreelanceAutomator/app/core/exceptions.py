@@ -15,3 +15,9 @@ class DatabaseError(FreelanceAssistantException):
 
 class ConfigurationError(FreelanceAssistantException):
     pass
+
+class CircuitOpenError(FreelanceAssistantException):
+    pass
+
+class LeaseLostError(FreelanceAssistantException):
+    pass
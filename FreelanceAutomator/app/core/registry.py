@@ -0,0 +1,89 @@
+import threading
+from typing import Any, Callable, Dict, Optional
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+class ServiceRegistry:
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._instances: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+    
+    def register(self, name: str, factory: Callable[[], Any]) -> None:
+        with self._lock:
+            self._factories[name] = factory
+            self._instances.pop(name, None)
+    
+    def get(self, name: str) -> Any:
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+        
+        with self._lock:
+            factory = self._factories.get(name)
+            if factory is None:
+                raise KeyError(f"Service not registered: {name}")
+            return self.get_or_create(name, factory)
+    
+    def get_or_create(self, name: str, factory: Callable[[], Any]) -> Any:
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+        
+        with self._lock:
+            instance = self._instances.get(name)
+            if instance is None:
+                instance = self._factories.get(name, factory)()
+                self._instances[name] = instance
+                logger.info(f"Initialized service: {name}")
+            return instance
+    
+    def shutdown(self) -> None:
+        with self._lock:
+            instances = list(self._instances.items())
+            self._instances.clear()
+        
+        for name, instance in instances:
+            close = getattr(instance, 'shutdown', None) or getattr(instance, 'close', None)
+            if close is None:
+                continue
+            try:
+                close()
+            except Exception as e:
+                logger.warning(f"Error shutting down service {name}: {e}")
+        
+        logger.info(f"Registry shut down ({len(instances)} services)")
+
+registry = ServiceRegistry()
+
+def register_default_services(target: Optional[ServiceRegistry] = None) -> ServiceRegistry:
+    target = target or registry
+    
+    def proposal_generator():
+        from app.ai.proposal_generator import ProposalGenerator
+        return ProposalGenerator()
+    
+    def job_scraper():
+        from app.tasks.job_scraper import JobScraper
+        return JobScraper()
+    
+    def content_generation_task():
+        from app.tasks.content_generator import ContentGenerationTask
+        return ContentGenerationTask()
+    
+    def proposal_batch_task():
+        from app.tasks.proposal_batches import ProposalBatchTask
+        return ProposalBatchTask()
+    
+    def task_worker():
+        from app.tasks.queue import TaskWorker
+        return TaskWorker()
+    
+    target.register('proposal_generator', proposal_generator)
+    target.register('job_scraper', job_scraper)
+    target.register('content_generation_task', content_generation_task)
+    target.register('proposal_batch_task', proposal_batch_task)
+    target.register('task_worker', task_worker)
+    
+    return target
@@ -1,69 +1,365 @@
+import base64
+import json
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import String, cast, delete, insert, literal, select, update, func, or_, and_, tuple_
+from sqlalchemy.engine import Row
+from sqlalchemy.sql.dml import Update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
-from typing import List, Optional, Dict, Any
-from app.database.models import Job, GeneratedContent, Proposal, UserSettings
+from typing import List, Optional, Dict, Any, Iterator, Sequence, Tuple, Union
+from app.database.models import Job, JobSkill, GeneratedContent, Proposal, UserSettings, FeedCache, ProposalBatch, Task
+from app.core.constants import JOB_STATUS, TASK_STATUS
+from app.utils.helpers import clean_text, content_hash, split_skills
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 def create_job(db: Session, job_data: Dict[str, Any]) -> Job:
     job = Job(**job_data)
+    if not job.content_hash:
+        job.content_hash = content_hash(job.title, job.description)
+    job.skills = [JobSkill(skill=skill) for skill in split_skills(job.skills_required)]
     db.add(job)
     db.commit()
     db.refresh(job)
     logger.info(f"Created job: {job.job_id}")
     return job
 
+def bulk_create_jobs(db: Session, jobs_data: List[Dict[str, Any]]) -> int:
+    unique_jobs: Dict[str, Dict[str, Any]] = {}
+    hashes: Dict[str, str] = {}
+    for job_data in jobs_data:
+        if job_data['job_id'] in unique_jobs:
+            continue
+        job_data = dict(job_data)
+        job_data['content_hash'] = job_data.get('content_hash') or content_hash(
+            job_data.get('title'), job_data.get('description')
+        )
+        if hashes.setdefault(job_data['content_hash'], job_data['job_id']) == job_data['job_id']:
+            unique_jobs[job_data['job_id']] = job_data
+    
+    if not unique_jobs:
+        return 0
+    
+    dialect = db.get_bind().dialect
+    
+    try:
+        duplicates = {
+            value for (value,) in
+            db.query(Job.content_hash).filter(Job.content_hash.in_(list(hashes)))
+        }
+        rows = [row for row in unique_jobs.values() if row['content_hash'] not in duplicates]
+        
+        if not rows:
+            inserted_ids = []
+        elif dialect.name in ('sqlite', 'postgresql') and dialect.insert_executemany_returning:
+            dialect_insert = sqlite_insert if dialect.name == 'sqlite' else postgresql_insert
+            stmt = (
+                dialect_insert(Job)
+                .on_conflict_do_nothing(index_elements=['job_id'])
+                .returning(Job.job_id)
+            )
+            inserted_ids = db.execute(stmt, rows).scalars().all()
+        else:
+            existing = {
+                job_id for (job_id,) in
+                db.query(Job.job_id).filter(Job.job_id.in_([row['job_id'] for row in rows]))
+            }
+            rows = [row for row in rows if row['job_id'] not in existing]
+            if rows:
+                db.execute(insert(Job), rows)
+            inserted_ids = [row['job_id'] for row in rows]
+        
+        skill_rows = [
+            {'job_id': job_id, 'skill': skill}
+            for job_id in inserted_ids
+            for skill in split_skills(unique_jobs[job_id].get('skills_required'))
+        ]
+        if skill_rows:
+            db.execute(insert(JobSkill), skill_rows)
+        
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    
+    inserted = len(inserted_ids)
+    logger.info(
+        f"Bulk inserted {inserted} of {len(jobs_data)} jobs "
+        f"({len(jobs_data) - len(unique_jobs) + len(duplicates)} duplicates by id or content)"
+    )
+    return inserted
+
 def get_job_by_id(db: Session, job_id: str) -> Optional[Job]:
     return db.query(Job).filter(Job.job_id == job_id).first()
 
 def get_all_jobs(db: Session, skip: int = 0, limit: int = 100) -> List[Job]:
     return db.query(Job).offset(skip).limit(limit).all()
 
-def get_jobs_by_status(db: Session, status: str) -> List[Job]:
-    return db.query(Job).filter(Job.status == status).all()
+def get_jobs_page(
+    db: Session,
+    status: Optional[str] = None,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    description_length: int = 200,
+    skill: Optional[str] = None
+) -> Tuple[List[Any], Optional[str]]:
+    query = db.query(
+        Job.id,
+        Job.job_id,
+        Job.title,
+        func.substr(Job.description, 1, description_length).label('description'),
+        (func.length(Job.description) > description_length).label('description_truncated'),
+        Job.category,
+        Job.budget,
+        Job.complexity,
+        Job.status,
+        Job.platform,
+        Job.url,
+        Job.created_at,
+        cast(Job.created_at, String).label('cursor_created_at')
+    )
+    
+    if status:
+        query = query.filter(Job.status == status)
+    
+    if skill:
+        query = query.join(JobSkill, JobSkill.job_id == Job.job_id).filter(
+            JobSkill.skill == clean_text(skill).lower()
+        )
+    
+    if cursor:
+        created_at, last_id = decode_job_cursor(cursor)
+        query = query.filter(
+            tuple_(Job.created_at, Job.id) < tuple_(literal(created_at, String), literal(last_id))
+        )
+    
+    rows = query.order_by(Job.created_at.desc(), Job.id.desc()).limit(limit + 1).all()
+    
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_job_cursor(rows[-1].cursor_created_at, rows[-1].id)
+    
+    return rows, next_cursor
+
+def encode_job_cursor(created_at: str, job_pk: int) -> str:
+    return base64.urlsafe_b64encode(f"{created_at}|{job_pk}".encode()).decode()
+
+def decode_job_cursor(cursor: str) -> Tuple[str, int]:
+    try:
+        created_at, job_pk = base64.urlsafe_b64decode(cursor.encode()).decode().rsplit('|', 1)
+        return created_at, int(job_pk)
+    except Exception:
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+def get_jobs_by_skill(db: Session, skill: str, limit: int = 50) -> List[Job]:
+    return (
+        db.query(Job)
+        .join(JobSkill, JobSkill.job_id == Job.job_id)
+        .filter(JobSkill.skill == clean_text(skill).lower())
+        .order_by(Job.created_at.desc(), Job.id.desc())
+        .limit(limit)
+        .all()
+    )
 
-def update_job_status(db: Session, job_id: str, status: str) -> Optional[Job]:
-    job = get_job_by_id(db, job_id)
-    if job:
-        job.status = status
+def get_jobs_by_status(db: Session, status: str, limit: Optional[int] = None) -> List[Job]:
+    query = db.query(Job).filter(Job.status == status).order_by(Job.created_at)
+    if limit is not None:
+        query = query.limit(limit)
+    return query.all()
+
+def claim_pending_jobs(db: Session, worker_id: str, limit: int, lease_seconds: int) -> List[str]:
+    if limit <= 0:
+        return []
+    
+    now = datetime.now(timezone.utc)
+    dialect = db.get_bind().dialect
+    
+    claimable = (
+        select(Job.id)
+        .where(or_(
+            Job.status == JOB_STATUS['PENDING'],
+            and_(Job.status == JOB_STATUS['IN_PROGRESS'], Job.lease_expires_at < now)
+        ))
+        .order_by(Job.created_at, Job.id)
+        .limit(limit)
+    )
+    if dialect.name == 'postgresql':
+        claimable = claimable.with_for_update(skip_locked=True)
+    
+    claim = (
+        update(Job)
+        .values(
+            status=JOB_STATUS['IN_PROGRESS'],
+            claimed_by=worker_id,
+            lease_expires_at=now + timedelta(seconds=lease_seconds)
+        )
+        .execution_options(synchronize_session=False)
+    )
+    
+    try:
+        if dialect.update_returning:
+            stmt = claim.where(Job.id.in_(claimable.scalar_subquery())).returning(Job.job_id)
+            job_ids = list(db.execute(stmt).scalars())
+        else:
+            ids = list(db.execute(claimable).scalars())
+            db.execute(claim.where(Job.id.in_(ids)))
+            job_ids = list(db.execute(
+                select(Job.job_id).where(Job.id.in_(ids), Job.claimed_by == worker_id)
+            ).scalars())
         db.commit()
-        db.refresh(job)
-        logger.info(f"Updated job {job_id} status to {status}")
-    return job
+    except Exception:
+        db.rollback()
+        raise
+    
+    if job_ids:
+        logger.info(f"Worker {worker_id} claimed {len(job_ids)} jobs")
+    return job_ids
+
+def claim_job(db: Session, job_id: str, worker_id: str, lease_seconds: int) -> bool:
+    now = datetime.now(timezone.utc)
+    
+    count, _ = _execute_write(
+        db,
+        update(Job)
+        .where(
+            Job.job_id == job_id,
+            or_(
+                Job.status.is_(None),
+                Job.status != JOB_STATUS['IN_PROGRESS'],
+                Job.lease_expires_at.is_(None),
+                Job.lease_expires_at < now
+            )
+        )
+        .values(
+            status=JOB_STATUS['IN_PROGRESS'],
+            claimed_by=worker_id,
+            lease_expires_at=now + timedelta(seconds=lease_seconds),
+            updated_at=func.now()
+        )
+    )
+    
+    if count:
+        logger.info(f"Worker {worker_id} claimed job {job_id}")
+    return bool(count)
+
+def renew_job_lease(db: Session, job_id: str, worker_id: str, lease_seconds: int) -> bool:
+    count, _ = _execute_write(
+        db,
+        update(Job)
+        .where(
+            Job.job_id == job_id,
+            Job.status == JOB_STATUS['IN_PROGRESS'],
+            Job.claimed_by == worker_id
+        )
+        .values(
+            lease_expires_at=datetime.now(timezone.utc) + timedelta(seconds=lease_seconds),
+            updated_at=func.now()
+        )
+    )
+    return bool(count)
+
+def count_jobs_by_status(db: Session) -> Dict[str, int]:
+    rows = db.query(Job.status, func.count(Job.id)).group_by(Job.status).all()
+    return {status: count for status, count in rows}
+
+def update_job_status(
+    db: Session,
+    job_id: str,
+    status: str,
+    commit: bool = True,
+    returning: bool = False,
+    worker_id: Optional[str] = None
+) -> Union[int, Optional[Row]]:
+    return update_jobs_status(
+        db,
+        [job_id],
+        status,
+        commit=commit,
+        returning=returning,
+        worker_id=worker_id,
+        single=True
+    )
 
-def create_generated_content(db: Session, job_id: str, content_type: str, text: str) -> GeneratedContent:
+def update_jobs_status(
+    db: Session,
+    job_ids: List[str],
+    status: str,
+    commit: bool = True,
+    returning: bool = False,
+    worker_id: Optional[str] = None,
+    single: bool = False
+) -> Union[int, List[Row], Optional[Row]]:
+    values = {'status': status, 'updated_at': func.now()}
+    if status != JOB_STATUS['IN_PROGRESS']:
+        values.update(claimed_by=None, lease_expires_at=None)
+    
+    conditions = [Job.job_id.in_(job_ids)]
+    if worker_id is not None:
+        conditions += [Job.claimed_by == worker_id, Job.lease_expires_at > datetime.now(timezone.utc)]
+    
+    count, rows = _execute_write(
+        db,
+        update(Job).where(*conditions).values(**values),
+        commit=commit,
+        returning=(Job.id, Job.job_id, Job.status, Job.updated_at) if returning else None,
+        reselect=select(Job.id, Job.job_id, Job.status, Job.updated_at).where(Job.job_id.in_(job_ids))
+    )
+    
+    if count:
+        logger.info(f"Updated {count} job(s) to status {status}")
+    if not returning:
+        return count
+    return (rows[0] if rows else None) if single else rows
+
+def create_generated_content(
+    db: Session,
+    job_id: str,
+    content_type: str,
+    text: str,
+    commit: bool = True,
+    refresh: bool = False
+) -> GeneratedContent:
     content = GeneratedContent(
         job_id=job_id,
         content_type=content_type,
         generated_text=text
     )
     db.add(content)
-    db.commit()
-    db.refresh(content)
+    _finish(db, commit, content if refresh else None)
     logger.info(f"Created generated content for job: {job_id}")
     return content
 
 def get_content_by_job_id(db: Session, job_id: str) -> List[GeneratedContent]:
     return db.query(GeneratedContent).filter(GeneratedContent.job_id == job_id).all()
 
-def delete_job(db: Session, job_id: str) -> bool:
-    job = get_job_by_id(db, job_id)
-    if job:
-        db.delete(job)
-        db.commit()
+def delete_job(db: Session, job_id: str, commit: bool = True) -> int:
+    for child in (GeneratedContent, Proposal, JobSkill):
+        db.execute(delete(child).where(child.job_id == job_id).execution_options(synchronize_session='fetch'))
+    
+    count, _ = _execute_write(db, delete(Job).where(Job.job_id == job_id), commit=commit)
+    if count:
         logger.info(f"Deleted job: {job_id}")
-        return True
-    return False
+    return count
 
-def create_proposal(db: Session, job_id: str, proposal_text: str, proposal_type: str = "standard") -> Proposal:
+def create_proposal(
+    db: Session,
+    job_id: str,
+    proposal_text: str,
+    proposal_type: str = "standard",
+    commit: bool = True,
+    refresh: bool = False
+) -> Proposal:
     proposal = Proposal(
         job_id=job_id,
         proposal_text=proposal_text,
         proposal_type=proposal_type
     )
     db.add(proposal)
-    db.commit()
-    db.refresh(proposal)
+    _finish(db, commit, proposal if refresh else None)
     logger.info(f"Created proposal for job: {job_id}")
     return proposal
 
@@ -73,23 +369,82 @@ def get_proposals_by_job_id(db: Session, job_id: str) -> List[Proposal]:
 def get_proposal_by_id(db: Session, proposal_id: int) -> Optional[Proposal]:
     return db.query(Proposal).filter(Proposal.id == proposal_id).first()
 
-def update_proposal(db: Session, proposal_id: int, proposal_text: str) -> Optional[Proposal]:
-    proposal = get_proposal_by_id(db, proposal_id)
-    if proposal:
-        proposal.proposal_text = proposal_text
-        db.commit()
-        db.refresh(proposal)
+def update_proposal(
+    db: Session,
+    proposal_id: int,
+    proposal_text: str,
+    commit: bool = True,
+    returning: bool = False
+) -> Union[int, Optional[Row]]:
+    columns = (Proposal.id, Proposal.job_id, Proposal.proposal_text, Proposal.proposal_type, Proposal.updated_at)
+    count, rows = _execute_write(
+        db,
+        update(Proposal)
+        .where(Proposal.id == proposal_id)
+        .values(proposal_text=proposal_text, updated_at=func.now()),
+        commit=commit,
+        returning=columns if returning else None,
+        reselect=select(*columns).where(Proposal.id == proposal_id)
+    )
+    
+    if count:
         logger.info(f"Updated proposal {proposal_id}")
-    return proposal
+    if returning:
+        return rows[0] if rows else None
+    return count
 
-def delete_proposal(db: Session, proposal_id: int) -> bool:
-    proposal = get_proposal_by_id(db, proposal_id)
-    if proposal:
-        db.delete(proposal)
-        db.commit()
+def delete_proposal(db: Session, proposal_id: int, commit: bool = True) -> int:
+    count, _ = _execute_write(db, delete(Proposal).where(Proposal.id == proposal_id), commit=commit)
+    if count:
         logger.info(f"Deleted proposal: {proposal_id}")
-        return True
-    return False
+    return count
+
+def get_jobs_without_proposals(
+    db: Session,
+    limit: int,
+    exclude_job_ids: Optional[List[str]] = None,
+    status: Optional[str] = None
+) -> List[Job]:
+    query = (
+        db.query(Job)
+        .filter(~Job.proposals.any())
+        .order_by(Job.created_at, Job.id)
+    )
+    if status:
+        query = query.filter(Job.status == status)
+    if exclude_job_ids:
+        query = query.filter(Job.job_id.notin_(exclude_job_ids))
+    return query.limit(limit).all()
+
+def create_proposal_batch(db: Session, batch_id: str, job_ids: List[str], proposal_type: str = "standard") -> ProposalBatch:
+    batch = ProposalBatch(
+        batch_id=batch_id,
+        proposal_type=proposal_type,
+        job_ids=json.dumps(job_ids),
+        request_count=len(job_ids)
+    )
+    db.add(batch)
+    db.commit()
+    logger.info(f"Created proposal batch {batch_id} with {len(job_ids)} requests")
+    return batch
+
+def get_open_proposal_batches(db: Session) -> List[ProposalBatch]:
+    return db.query(ProposalBatch).filter(ProposalBatch.status == 'in_progress').all()
+
+def get_open_batch_job_ids(db: Session) -> List[str]:
+    job_ids = []
+    for (raw_ids,) in db.query(ProposalBatch.job_ids).filter(ProposalBatch.status == 'in_progress'):
+        job_ids.extend(json.loads(raw_ids or '[]'))
+    return job_ids
+
+def complete_proposal_batch(db: Session, batch: ProposalBatch, succeeded: int, errored: int) -> ProposalBatch:
+    batch.status = 'ended'
+    batch.succeeded_count = succeeded
+    batch.errored_count = errored
+    batch.completed_at = datetime.now(timezone.utc)
+    db.commit()
+    logger.info(f"Proposal batch {batch.batch_id} ended: {succeeded} succeeded, {errored} errored")
+    return batch
 
 def get_setting(db: Session, key: str) -> Optional[str]:
     setting = db.query(UserSettings).filter(UserSettings.key == key).first()
@@ -106,3 +461,192 @@ def set_setting(db: Session, key: str, value: str) -> UserSettings:
     db.refresh(setting)
     logger.info(f"Set setting {key}")
     return setting
+
+def get_feed_cache(db: Session, feed_url: str) -> Optional[FeedCache]:
+    return db.query(FeedCache).filter(FeedCache.feed_url == feed_url).first()
+
+def save_feed_cache(
+    db: Session,
+    feed_url: str,
+    etag: Optional[str],
+    last_modified: Optional[str],
+    entry_digests: Optional[str]
+) -> FeedCache:
+    cache = get_feed_cache(db, feed_url)
+    if not cache:
+        cache = FeedCache(feed_url=feed_url)
+        db.add(cache)
+    cache.etag = etag
+    cache.last_modified = last_modified
+    cache.entry_digests = entry_digests
+    db.commit()
+    logger.debug(f"Saved feed cache for {feed_url}")
+    return cache
+
+def create_task(
+    db: Session,
+    task_id: str,
+    name: str,
+    payload: Dict[str, Any],
+    max_attempts: int = 1,
+    commit: bool = True
+) -> Task:
+    task = Task(
+        task_id=task_id,
+        name=name,
+        payload=json.dumps(payload),
+        status=TASK_STATUS['QUEUED'],
+        max_attempts=max_attempts,
+        run_after=datetime.now(timezone.utc)
+    )
+    db.add(task)
+    _finish(db, commit)
+    logger.info(f"Queued task {name} ({task_id})")
+    return task
+
+def get_task(db: Session, task_id: str) -> Optional[Task]:
+    return db.query(Task).filter(Task.task_id == task_id).first()
+
+def claim_tasks(db: Session, worker_id: str, limit: int, lease_seconds: int) -> List[Row]:
+    if limit <= 0:
+        return []
+    
+    now = datetime.now(timezone.utc)
+    dialect = db.get_bind().dialect
+    
+    claimable = (
+        select(Task.id)
+        .where(or_(
+            and_(Task.status == TASK_STATUS['QUEUED'], Task.run_after <= now),
+            and_(Task.status == TASK_STATUS['RUNNING'], Task.lease_expires_at < now)
+        ))
+        .order_by(Task.run_after, Task.id)
+        .limit(limit)
+    )
+    if dialect.name == 'postgresql':
+        claimable = claimable.with_for_update(skip_locked=True)
+    
+    claim = (
+        update(Task)
+        .values(
+            status=TASK_STATUS['RUNNING'],
+            claimed_by=worker_id,
+            lease_expires_at=now + timedelta(seconds=lease_seconds),
+            attempts=Task.attempts + 1,
+            updated_at=now
+        )
+        .execution_options(synchronize_session=False)
+    )
+    columns = (Task.task_id, Task.name, Task.payload, Task.attempts, Task.max_attempts)
+    
+    try:
+        if dialect.update_returning:
+            stmt = claim.where(Task.id.in_(claimable.scalar_subquery())).returning(*columns)
+            tasks = db.execute(stmt).all()
+        else:
+            ids = list(db.execute(claimable).scalars())
+            db.execute(claim.where(Task.id.in_(ids)))
+            tasks = db.execute(
+                select(*columns).where(Task.id.in_(ids), Task.claimed_by == worker_id)
+            ).all()
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    
+    if tasks:
+        logger.info(f"Worker {worker_id} claimed {len(tasks)} tasks")
+    return tasks
+
+def complete_task(db: Session, task_id: str, worker_id: str, result: Any) -> int:
+    count, _ = _execute_write(
+        db,
+        update(Task)
+        .where(Task.task_id == task_id, Task.claimed_by == worker_id)
+        .values(
+            status=TASK_STATUS['SUCCEEDED'],
+            result=json.dumps(result, default=str),
+            error=None,
+            lease_expires_at=None,
+            finished_at=func.now(),
+            updated_at=func.now()
+        )
+    )
+    return count
+
+def fail_task(db: Session, task_id: str, worker_id: str, error: str, retry_delay: Optional[float] = None) -> int:
+    values: Dict[str, Any] = {'error': error, 'lease_expires_at': None, 'updated_at': func.now()}
+    if retry_delay is None:
+        values.update(status=TASK_STATUS['FAILED'], finished_at=func.now())
+    else:
+        values.update(
+            status=TASK_STATUS['QUEUED'],
+            run_after=datetime.now(timezone.utc) + timedelta(seconds=retry_delay),
+            claimed_by=None
+        )
+    
+    count, _ = _execute_write(
+        db,
+        update(Task).where(Task.task_id == task_id, Task.claimed_by == worker_id).values(**values)
+    )
+    return count
+
+def purge_finished_tasks(db: Session, older_than: datetime) -> int:
+    count, _ = _execute_write(
+        db,
+        delete(Task).where(
+            Task.status.in_([TASK_STATUS['SUCCEEDED'], TASK_STATUS['FAILED']]),
+            Task.finished_at < older_than
+        )
+    )
+    if count:
+        logger.info(f"Purged {count} finished tasks")
+    return count
+
+@contextmanager
+def unit_of_work(db: Session) -> Iterator[Session]:
+    try:
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+def _execute_write(
+    db: Session,
+    stmt: Any,
+    commit: bool = True,
+    returning: Optional[Sequence[Any]] = None,
+    reselect: Any = None
+) -> Tuple[int, List[Row]]:
+    dialect = db.get_bind().dialect
+    if isinstance(stmt, Update):
+        stmt = stmt.execution_options(synchronize_session=False)
+        supports_returning = dialect.update_returning
+    else:
+        stmt = stmt.execution_options(synchronize_session='fetch')
+        supports_returning = dialect.delete_returning
+    rows: List[Row] = []
+    
+    try:
+        if returning and supports_returning:
+            rows = db.execute(stmt.returning(*returning)).all()
+            count = len(rows)
+        else:
+            count = db.execute(stmt).rowcount
+            if returning and count and reselect is not None:
+                rows = db.execute(reselect).all()
+        _finish(db, commit)
+    except Exception:
+        db.rollback()
+        raise
+    
+    return count, rows
+
+def _finish(db: Session, commit: bool, refresh: Any = None) -> None:
+    if commit:
+        db.commit()
+    elif refresh is not None:
+        db.flush()
+    if refresh is not None:
+        db.refresh(refresh)
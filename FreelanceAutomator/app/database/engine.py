@@ -0,0 +1,72 @@
+from typing import Any, Dict, Optional
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from app.core.config import Config
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+def sqlite_pragmas() -> Dict[str, Any]:
+    return {
+        'journal_mode': Config.SQLITE_JOURNAL_MODE,
+        'synchronous': Config.SQLITE_SYNCHRONOUS,
+        'busy_timeout': Config.SQLITE_BUSY_TIMEOUT_MS,
+        'mmap_size': Config.SQLITE_MMAP_SIZE,
+        'cache_size': -Config.SQLITE_CACHE_SIZE_KB,
+        'foreign_keys': 'ON' if Config.SQLITE_FOREIGN_KEYS else 'OFF'
+    }
+
+def engine_options(url: str) -> Dict[str, Any]:
+    options: Dict[str, Any] = {'echo': Config.DATABASE_ECHO}
+    backend = make_url(url).get_backend_name()
+    
+    if backend == 'sqlite':
+        options['connect_args'] = {
+            'timeout': Config.SQLITE_BUSY_TIMEOUT_MS / 1000,
+            'check_same_thread': False
+        }
+        return options
+    
+    options.update(
+        pool_size=Config.DATABASE_POOL_SIZE,
+        max_overflow=Config.DATABASE_MAX_OVERFLOW,
+        pool_timeout=Config.DATABASE_POOL_TIMEOUT,
+        pool_recycle=Config.DATABASE_POOL_RECYCLE,
+        pool_pre_ping=Config.DATABASE_POOL_PRE_PING,
+        pool_use_lifo=True
+    )
+    return options
+
+def create_database_engine(url: Optional[str] = None) -> Engine:
+    url = url or Config.DATABASE_URL
+    engine = create_engine(url, **engine_options(url))
+    
+    if engine.dialect.name == 'sqlite':
+        pragmas = sqlite_pragmas()
+        if _is_memory_database(engine):
+            pragmas.pop('journal_mode')
+            pragmas.pop('mmap_size')
+        event.listen(engine, 'connect', _pragma_listener(pragmas))
+        logger.info(f"SQLite engine configured with {pragmas}")
+    else:
+        logger.info(
+            f"{engine.dialect.name} engine pool: size={Config.DATABASE_POOL_SIZE}, "
+            f"overflow={Config.DATABASE_MAX_OVERFLOW}, recycle={Config.DATABASE_POOL_RECYCLE}s"
+        )
+    
+    return engine
+
+def _pragma_listener(pragmas: Dict[str, Any]):
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+    
+    return set_pragmas
+
+def _is_memory_database(engine: Engine) -> bool:
+    database = engine.url.database
+    return not database or database == ':memory:' or 'mode=memory' in str(engine.url)
@@ -0,0 +1,103 @@
+import os
+import threading
+from typing import List, Optional
+from alembic import command, op
+from alembic.config import Config as AlembicConfig
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect
+from sqlalchemy.engine import Engine
+from app.core.config import Config
+from app.core.exceptions import DatabaseError
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+ALEMBIC_INI = os.path.join(PROJECT_ROOT, 'alembic.ini')
+BASELINE_REVISION = '0001'
+
+_schema_lock = threading.Lock()
+_schema_current = False
+
+def include_name(name, type_, parent_names) -> bool:
+    if type_ == 'table':
+        return not name.startswith('jobs_fts')
+    return True
+
+def include_object(obj, name, type_, reflected, compare_to) -> bool:
+    if type_ == 'column' and name == 'search_vector':
+        return False
+    if type_ == 'index' and name == 'ix_jobs_search_vector':
+        return False
+    return True
+
+def has_table(table: str) -> bool:
+    return inspect(op.get_bind()).has_table(table)
+
+def has_column(table: str, column: str) -> bool:
+    return any(c['name'] == column for c in inspect(op.get_bind()).get_columns(table))
+
+def has_index(table: str, index: str) -> bool:
+    return any(i['name'] == index for i in inspect(op.get_bind()).get_indexes(table))
+
+def indexes_on(table: str, columns: List[str]) -> List[str]:
+    return [
+        i['name'] for i in inspect(op.get_bind()).get_indexes(table)
+        if i['column_names'] == columns
+    ]
+
+def get_alembic_config() -> AlembicConfig:
+    alembic_config = AlembicConfig(ALEMBIC_INI)
+    alembic_config.set_main_option('script_location', os.path.join(PROJECT_ROOT, 'migrations'))
+    alembic_config.attributes['configure_logger'] = False
+    return alembic_config
+
+def head_revision(alembic_config: Optional[AlembicConfig] = None) -> Optional[str]:
+    return ScriptDirectory.from_config(alembic_config or get_alembic_config()).get_current_head()
+
+def current_revision(engine: Engine) -> Optional[str]:
+    with engine.connect() as connection:
+        return MigrationContext.configure(connection).get_current_revision()
+
+def upgrade_database(engine: Engine, revision: str = 'head') -> bool:
+    alembic_config = get_alembic_config()
+    stamped = False
+    
+    with engine.begin() as connection:
+        alembic_config.attributes['connection'] = connection
+        
+        if MigrationContext.configure(connection).get_current_revision() is None:
+            if inspect(connection).has_table('jobs'):
+                logger.info(f"Stamping unversioned database at baseline revision {BASELINE_REVISION}")
+                command.stamp(alembic_config, BASELINE_REVISION)
+                stamped = True
+        
+        command.upgrade(alembic_config, revision)
+    
+    return stamped
+
+def ensure_schema(engine: Engine, auto_migrate: Optional[bool] = None) -> None:
+    global _schema_current
+    if _schema_current:
+        return
+    
+    auto_migrate = Config.DATABASE_AUTO_MIGRATE if auto_migrate is None else auto_migrate
+    
+    with _schema_lock:
+        if _schema_current:
+            return
+        
+        head = head_revision()
+        current = current_revision(engine)
+        
+        if current != head:
+            if not auto_migrate:
+                raise DatabaseError(
+                    f"Database schema is at {current or 'an unversioned state'}, expected {head}; "
+                    f"run 'alembic upgrade head'"
+                )
+            logger.info(f"Migrating database schema from {current or 'unversioned'} to {head}")
+            upgrade_database(engine)
+        
+        _schema_current = True
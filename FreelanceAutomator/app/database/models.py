@@ -1,8 +1,8 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database.session import Base
-from app.core.constants import JOB_STATUS
+from app.core.constants import JOB_STATUS, TASK_STATUS
 import enum
 
 class JobStatusEnum(enum.Enum):
@@ -28,12 +28,22 @@ class Job(Base):
     status = Column(String, default=JOB_STATUS['PENDING'])
     posted_date = Column(DateTime, nullable=True)
     skills_required = Column(Text, nullable=True)
+    content_hash = Column(String(32), nullable=True, index=True)
+    claimed_by = Column(String, nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True)
     
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     
     contents = relationship("GeneratedContent", back_populates="job", cascade="all, delete-orphan")
     proposals = relationship("Proposal", back_populates="job", cascade="all, delete-orphan")
+    skills = relationship("JobSkill", back_populates="job", cascade="all, delete-orphan")
+    
+    __table_args__ = (
+        Index('ix_jobs_status_created_at', 'status', 'created_at', 'id'),
+        Index('ix_jobs_status_lease_expires_at', 'status', 'lease_expires_at'),
+        Index('ix_jobs_created_at_id', 'created_at', 'id'),
+    )
     
     def __repr__(self):
         return f"<Job {self.job_id}: {self.title}>"
@@ -57,7 +67,7 @@ class Proposal(Base):
     __tablename__ = "proposals"
     
     id = Column(Integer, primary_key=True, index=True)
-    job_id = Column(String, ForeignKey('jobs.job_id'), index=True)
+    job_id = Column(String, ForeignKey('jobs.job_id'))
     proposal_text = Column(Text)
     proposal_type = Column(String, default="standard")
     is_sent = Column(Integer, default=0)
@@ -68,9 +78,57 @@ class Proposal(Base):
     
     job = relationship("Job", back_populates="proposals")
     
+    __table_args__ = (
+        Index('ix_proposals_job_id_is_sent', 'job_id', 'is_sent'),
+    )
+    
     def __repr__(self):
         return f"<Proposal for {self.job_id}>"
 
+class Task(Base):
+    __tablename__ = "tasks"
+    
+    id = Column(Integer, primary_key=True)
+    task_id = Column(String(32), unique=True, index=True)
+    name = Column(String, nullable=False)
+    payload = Column(Text, nullable=True)
+    status = Column(String, default=TASK_STATUS['QUEUED'])
+    result = Column(Text, nullable=True)
+    error = Column(Text, nullable=True)
+    attempts = Column(Integer, default=0)
+    max_attempts = Column(Integer, default=1)
+    run_after = Column(DateTime, server_default=func.now())
+    claimed_by = Column(String, nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    
+    __table_args__ = (
+        Index('ix_tasks_status_run_after', 'status', 'run_after', 'id'),
+    )
+    
+    def __repr__(self):
+        return f"<Task {self.task_id}: {self.name} {self.status}>"
+
+class JobSkill(Base):
+    __tablename__ = "job_skills"
+    
+    id = Column(Integer, primary_key=True)
+    job_id = Column(String, ForeignKey('jobs.job_id', ondelete='CASCADE'), nullable=False)
+    skill = Column(String, nullable=False)
+    
+    job = relationship("Job", back_populates="skills")
+    
+    __table_args__ = (
+        UniqueConstraint('job_id', 'skill', name='uq_job_skills_job_id_skill'),
+        Index('ix_job_skills_skill_job_id', 'skill', 'job_id'),
+    )
+    
+    def __repr__(self):
+        return f"<JobSkill {self.job_id}: {self.skill}>"
+
 class UserSettings(Base):
     __tablename__ = "user_settings"
     
@@ -83,3 +141,37 @@ class UserSettings(Base):
     
     def __repr__(self):
         return f"<UserSettings {self.key}: {self.value}>"
+
+class FeedCache(Base):
+    __tablename__ = "feed_cache"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    feed_url = Column(String, unique=True, index=True)
+    etag = Column(String, nullable=True)
+    last_modified = Column(String, nullable=True)
+    entry_digests = Column(Text, nullable=True)
+    
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<FeedCache {self.feed_url}>"
+
+class ProposalBatch(Base):
+    __tablename__ = "proposal_batches"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    batch_id = Column(String, unique=True, index=True)
+    proposal_type = Column(String, default="standard")
+    status = Column(String, default="in_progress", index=True)
+    job_ids = Column(Text)
+    request_count = Column(Integer, default=0)
+    succeeded_count = Column(Integer, default=0)
+    errored_count = Column(Integer, default=0)
+    completed_at = Column(DateTime, nullable=True)
+    
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<ProposalBatch {self.batch_id}: {self.status}>"
@@ -0,0 +1,76 @@
+import re
+from typing import Any, List, Tuple
+from sqlalchemy import Boolean, DateTime, func, literal, or_, text
+from sqlalchemy.orm import Session
+from app.database.models import Job
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+SEARCH_COLUMNS = """jobs.id, jobs.job_id, jobs.title,
+    substr(jobs.description, 1, :description_length) AS description,
+    length(jobs.description) > :description_length AS description_truncated,
+    jobs.category, jobs.budget, jobs.complexity, jobs.status, jobs.platform, jobs.url, jobs.created_at"""
+
+def search_jobs(
+    db: Session,
+    query: str,
+    limit: int = 20,
+    offset: int = 0,
+    description_length: int = 200
+) -> List[Any]:
+    terms = re.findall(r'\w+', query, flags=re.UNICODE)
+    if not terms:
+        return []
+    
+    dialect = db.get_bind().dialect.name
+    params = {'limit': limit, 'offset': offset, 'description_length': description_length}
+    
+    if dialect == 'sqlite':
+        params['query'] = ' '.join(f'"{term}"*' for term in terms)
+        statement = text(f"""
+            SELECT {SEARCH_COLUMNS}, bm25(jobs_fts, 10.0, 1.0) AS rank
+            FROM jobs_fts JOIN jobs ON jobs.id = jobs_fts.rowid
+            WHERE jobs_fts MATCH :query
+            ORDER BY rank, jobs.id DESC
+            LIMIT :limit OFFSET :offset
+        """).columns(created_at=DateTime, description_truncated=Boolean)
+        return db.execute(statement, params).all()
+    
+    if dialect == 'postgresql':
+        params['query'] = ' '.join(terms)
+        statement = text(f"""
+            SELECT {SEARCH_COLUMNS}, ts_rank(jobs.search_vector, query) AS rank
+            FROM jobs, websearch_to_tsquery('simple', :query) AS query
+            WHERE jobs.search_vector @@ query
+            ORDER BY rank DESC, jobs.id DESC
+            LIMIT :limit OFFSET :offset
+        """).columns(created_at=DateTime, description_truncated=Boolean)
+        return db.execute(statement, params).all()
+    
+    conditions = [
+        or_(Job.title.ilike(f'%{term}%'), Job.description.ilike(f'%{term}%'))
+        for term in terms
+    ]
+    return (
+        db.query(
+            Job.id,
+            Job.job_id,
+            Job.title,
+            func.substr(Job.description, 1, description_length).label('description'),
+            (func.length(Job.description) > description_length).label('description_truncated'),
+            Job.category,
+            Job.budget,
+            Job.complexity,
+            Job.status,
+            Job.platform,
+            Job.url,
+            Job.created_at,
+            literal(0.0).label('rank')
+        )
+        .filter(*conditions)
+        .order_by(Job.created_at.desc(), Job.id.desc())
+        .limit(limit)
+        .offset(offset)
+        .all()
+    )
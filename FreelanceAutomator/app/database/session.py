@@ -1,12 +1,12 @@
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, scoped_session
 from sqlalchemy.ext.declarative import declarative_base
 from app.core.config import Config
+from app.database.engine import create_database_engine
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-engine = create_engine(Config.DATABASE_URL, echo=False)
+engine = create_database_engine(Config.DATABASE_URL)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Session = scoped_session(SessionLocal)
@@ -15,7 +15,8 @@ Base = declarative_base()
 
 def init_db():
     import app.database.models
-    Base.metadata.create_all(bind=engine)
+    from app.database.migrations import ensure_schema
+    ensure_schema(engine)
     logger.info("Database initialized successfully")
 
 def get_db():
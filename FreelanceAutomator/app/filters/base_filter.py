@@ -1,10 +1,28 @@
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
 
 class BaseFilter(ABC):
+    supports_columnar = False
+    
+    @property
+    def name(self) -> str:
+        return type(self).__name__
+    
     @abstractmethod
-    def filter(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def matches(self, job: Dict[str, Any]) -> bool:
         pass
     
+    def mask(self, columns):
+        return None
+    
+    def filter(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        filtered = [job for job in jobs if self.matches(job)]
+        
+        logger.info(f"{self.name}: {len(jobs)} -> {len(filtered)} jobs")
+        return filtered
+    
     def __call__(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         return self.filter(jobs)
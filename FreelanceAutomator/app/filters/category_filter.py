@@ -1,18 +1,14 @@
 from typing import List, Dict, Any
 from app.filters.base_filter import BaseFilter
-from app.utils.logger import get_logger
-
-logger = get_logger(__name__)
 
 class CategoryFilter(BaseFilter):
+    supports_columnar = True
+    
     def __init__(self, allowed_categories: List[str]):
-        self.allowed_categories = [cat.lower() for cat in allowed_categories]
+        self.allowed_categories = frozenset(cat.strip().lower() for cat in allowed_categories)
+    
+    def matches(self, job: Dict[str, Any]) -> bool:
+        return (job.get('category') or '').lower() in self.allowed_categories
     
-    def filter(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        filtered = [
-            job for job in jobs
-            if job.get('category', '').lower() in self.allowed_categories
-        ]
-        
-        logger.info(f"CategoryFilter: {len(jobs)} -> {len(filtered)} jobs")
-        return filtered
+    def mask(self, columns):
+        return columns.isin('category', self.allowed_categories)
@@ -1,18 +1,14 @@
-from typing import List, Dict, Any
+from typing import Dict, Any
 from app.filters.base_filter import BaseFilter
-from app.utils.logger import get_logger
-
-logger = get_logger(__name__)
 
 class ComplexityFilter(BaseFilter):
+    supports_columnar = True
+    
     def __init__(self, max_complexity: int = 2):
         self.max_complexity = max_complexity
     
-    def filter(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        filtered = [
-            job for job in jobs
-            if job.get('complexity', 1) <= self.max_complexity
-        ]
-        
-        logger.info(f"ComplexityFilter: {len(jobs)} -> {len(filtered)} jobs")
-        return filtered
+    def matches(self, job: Dict[str, Any]) -> bool:
+        return job.get('complexity', 1) <= self.max_complexity
+    
+    def mask(self, columns):
+        return columns.numeric('complexity', default=1) <= self.max_complexity
@@ -0,0 +1,170 @@
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+from app.filters.base_filter import BaseFilter
+from app.core.config import Config
+from app.utils.logger import get_logger
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+logger = get_logger(__name__)
+
+@dataclass
+class FilterResult:
+    jobs: List[Dict[str, Any]]
+    total: int
+    rejected: Dict[str, int] = field(default_factory=dict)
+    mode: str = 'row'
+    elapsed_ms: float = 0.0
+    mask: Any = None
+
+class JobColumns:
+    def __init__(self, jobs: Optional[List[Dict[str, Any]]] = None, arrays: Optional[Dict[str, Any]] = None):
+        if np is None:
+            raise RuntimeError("numpy is required for columnar filtering")
+        
+        self.np = np
+        self.jobs = jobs
+        self._cache: Dict[str, Any] = {}
+        self._categoricals: Dict[str, Any] = {}
+        self._arrays: Dict[str, Any] = {}
+        
+        for key, value in (arrays or {}).items():
+            if isinstance(value, tuple):
+                codes, labels = value
+                self._categoricals[key] = (np.asarray(codes), list(labels))
+            else:
+                self._arrays[key] = np.asarray(value)
+        
+        if jobs is not None:
+            self.size = len(jobs)
+        elif self._arrays:
+            self.size = len(next(iter(self._arrays.values())))
+        elif self._categoricals:
+            self.size = len(next(iter(self._categoricals.values()))[0])
+        else:
+            self.size = 0
+    
+    @classmethod
+    def from_arrays(cls, **arrays) -> 'JobColumns':
+        return cls(arrays=arrays)
+    
+    def numeric(self, key: str, default: Optional[float] = None):
+        cache_key = f'numeric:{key}:{default}'
+        if cache_key not in self._cache:
+            missing = float('nan') if default is None else default
+            if key in self._arrays:
+                column = self._arrays[key].astype(np.float64)
+                if default is not None:
+                    column = np.where(np.isnan(column), missing, column)
+            else:
+                column = np.fromiter(
+                    (missing if value is None else value for value in self._values(key, default)),
+                    dtype=np.float64,
+                    count=self.size
+                )
+            self._cache[cache_key] = column
+        return self._cache[cache_key]
+    
+    def categorical(self, key: str):
+        if key not in self._categoricals:
+            values = self._arrays[key].tolist() if key in self._arrays else self._values(key)
+            index: Dict[Any, int] = {}
+            codes = np.fromiter(
+                (index.setdefault(value, len(index)) for value in values),
+                dtype=np.int64,
+                count=self.size
+            )
+            self._categoricals[key] = (codes, list(index))
+        return self._categoricals[key]
+    
+    def isin(self, key: str, values: Iterable[str]):
+        codes, labels = self.categorical(key)
+        allowed = frozenset(values)
+        lookup = np.fromiter(((label or '').lower() in allowed for label in labels), dtype=bool, count=len(labels))
+        return lookup[codes]
+    
+    def _values(self, key: str, default: Any = None) -> List[Any]:
+        if self.jobs is None:
+            raise KeyError(f"Column {key} not provided")
+        return [job.get(key, default) for job in self.jobs]
+
+class FilterEngine:
+    def __init__(self, filters: List[BaseFilter], columnar_threshold: Optional[int] = None):
+        self.filters = list(filters)
+        self.columnar_threshold = (
+            Config.FILTER_COLUMNAR_THRESHOLD if columnar_threshold is None else columnar_threshold
+        )
+        self._predicates = [(f.name, f.matches) for f in self.filters]
+        self._vectorised = np is not None and all(f.supports_columnar for f in self.filters)
+    
+    @property
+    def columnar_available(self) -> bool:
+        return self._vectorised
+    
+    def run(self, jobs: List[Dict[str, Any]], columnar: Optional[bool] = None) -> FilterResult:
+        if columnar is None:
+            columnar = self._vectorised and len(jobs) >= self.columnar_threshold
+        elif columnar and not self._vectorised:
+            logger.warning("Columnar filtering unavailable (numpy missing or filter without mask), using row mode")
+            columnar = False
+        
+        started = time.perf_counter()
+        result = self._run_columnar(jobs) if columnar else self._run_rows(jobs)
+        result.elapsed_ms = (time.perf_counter() - started) * 1000
+        
+        rejected = ', '.join(f"{name}={count}" for name, count in result.rejected.items())
+        logger.info(
+            f"Filtered {result.total} -> {len(result.jobs)} jobs "
+            f"in {result.elapsed_ms:.1f}ms ({result.mode}; rejected: {rejected or 'none'})"
+        )
+        return result
+    
+    def run_columns(self, columns: JobColumns) -> FilterResult:
+        if not self._vectorised:
+            raise RuntimeError("Columnar filtering unavailable (numpy missing or filter without mask)")
+        
+        started = time.perf_counter()
+        result = self._evaluate(columns)
+        result.elapsed_ms = (time.perf_counter() - started) * 1000
+        
+        logger.info(
+            f"Filtered {result.total} -> {int(np.count_nonzero(result.mask))} rows "
+            f"in {result.elapsed_ms:.1f}ms (columnar; rejected: {result.rejected})"
+        )
+        return result
+    
+    def __call__(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return self.run(jobs).jobs
+    
+    def _run_rows(self, jobs: List[Dict[str, Any]]) -> FilterResult:
+        rejected = {name: 0 for name, _ in self._predicates}
+        kept = []
+        
+        for job in jobs:
+            for name, predicate in self._predicates:
+                if not predicate(job):
+                    rejected[name] += 1
+                    break
+            else:
+                kept.append(job)
+        
+        return FilterResult(jobs=kept, total=len(jobs), rejected=rejected, mode='row')
+    
+    def _run_columnar(self, jobs: List[Dict[str, Any]]) -> FilterResult:
+        return self._evaluate(JobColumns(jobs))
+    
+    def _evaluate(self, columns: JobColumns) -> FilterResult:
+        alive = np.ones(columns.size, dtype=bool)
+        rejected = {}
+        
+        for f in self.filters:
+            passed = f.mask(columns)
+            rejected[f.name] = int(np.count_nonzero(alive & ~passed))
+            alive &= passed
+        
+        kept = [columns.jobs[i] for i in np.flatnonzero(alive)] if columns.jobs is not None else []
+        return FilterResult(jobs=kept, total=columns.size, rejected=rejected, mode='columnar', mask=alive)
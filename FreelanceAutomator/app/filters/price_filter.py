@@ -1,31 +1,35 @@
-from typing import List, Dict, Any, Optional
+from typing import Dict, Any, Optional
 from app.filters.base_filter import BaseFilter
-from app.utils.logger import get_logger
-
-logger = get_logger(__name__)
 
 class PriceFilter(BaseFilter):
+    supports_columnar = True
+    
     def __init__(self, min_price: Optional[float] = None, max_price: Optional[float] = None):
         self.min_price = min_price
         self.max_price = max_price
     
-    def filter(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        filtered = []
+    def matches(self, job: Dict[str, Any]) -> bool:
+        budget = job.get('budget')
+        
+        if budget is None:
+            return True
+        
+        if self.min_price and budget < self.min_price:
+            return False
+        
+        if self.max_price and budget > self.max_price:
+            return False
+        
+        return True
+    
+    def mask(self, columns):
+        budget = columns.numeric('budget')
+        result = columns.np.ones(len(budget), dtype=bool)
+        
+        if self.min_price:
+            result &= ~(budget < self.min_price)
         
-        for job in jobs:
-            budget = job.get('budget')
-            
-            if budget is None:
-                filtered.append(job)
-                continue
-            
-            if self.min_price and budget < self.min_price:
-                continue
-            
-            if self.max_price and budget > self.max_price:
-                continue
-            
-            filtered.append(job)
+        if self.max_price:
+            result &= ~(budget > self.max_price)
         
-        logger.info(f"PriceFilter: {len(jobs)} -> {len(filtered)} jobs")
-        return filtered
+        return result
@@ -1,5 +1,7 @@
 import os
 from app import create_app
+from app.core.config import Config
+from app.core.registry import registry
 from app.database.session import init_db
 from app.tasks.scheduler import TaskScheduler
 from app.utils.logger import get_logger
@@ -7,13 +9,10 @@ from app.utils.logger import get_logger
 logger = get_logger(__name__)
 
 app = create_app()
+init_db()
 
 scheduler = None
 
-@app.before_request
-def initialize():
-    init_db()
-
 def start_scheduler():
     global scheduler
     if scheduler is None:
@@ -21,11 +20,14 @@ def start_scheduler():
         scheduler.start()
         logger.info("Scheduler started")
 
+def start_task_worker():
+    if Config.TASK_EMBEDDED_WORKER:
+        registry.get('task_worker').start()
+        logger.info("Embedded task worker started")
+
 if __name__ == '__main__':
-    init_db()
-    logger.info("Database initialized")
-    
     start_scheduler()
+    start_task_worker()
     
     port = int(os.environ.get('PORT', 5000))
     app.run(host='0.0.0.0', port=port, debug=True)
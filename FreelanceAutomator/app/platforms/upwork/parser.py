@@ -1,17 +1,25 @@
 import requests
 import feedparser
-from bs4 import BeautifulSoup
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import hashlib
+import json
 import re
 
 from app.platforms.base_platform import BasePlatform
 from app.platforms.upwork.models import UpworkJob
+from app.core.config import Config
 from app.core.constants import UPWORK_RSS_FEEDS
 from app.core.exceptions import JobParsingError
+from app.database.session import Session
+from app.database import crud
 from app.utils.logger import get_logger
-from app.utils.helpers import extract_price_from_text, clean_text
+from app.utils.helpers import extract_price_from_text, clean_text, content_hash
+from app.utils.keywords import get_job_classifier
+from app.utils.text_extraction import extract_text
+from app.utils.circuit_breaker import get_circuit_breaker
+from app.utils.rate_limiter import get_rate_limiter
 
 logger = get_logger(__name__)
 
@@ -19,17 +27,54 @@ class UpworkParser(BasePlatform):
     def __init__(self):
         super().__init__("Upwork")
         self.base_url = "https://www.upwork.com"
+        self.rate_limiter = get_rate_limiter('upwork', requests_per_minute=Config.UPWORK_REQUESTS_PER_MINUTE)
+        self.circuit_breaker = get_circuit_breaker(
+            'upwork',
+            failure_threshold=Config.UPWORK_CIRCUIT_FAILURE_THRESHOLD,
+            recovery_timeout=Config.UPWORK_CIRCUIT_RECOVERY_SECONDS
+        )
     
-    def fetch_jobs(self, category: str = "reviews", max_jobs: int = 20) -> List[Dict[str, Any]]:
+    def fetch_jobs(
+        self,
+        category: str = "reviews",
+        max_jobs: int = 20,
+        timeout: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        return self.poll_feed(category, max_jobs, timeout)[0]
+    
+    def poll_feed(
+        self,
+        category: str = "reviews",
+        max_jobs: int = 20,
+        timeout: Optional[float] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
         logger.info(f"Fetching jobs from Upwork category: {category}")
         
         rss_url = UPWORK_RSS_FEEDS.get(category, UPWORK_RSS_FEEDS['reviews'])
         
         try:
-            feed = feedparser.parse(rss_url)
+            cache = self._load_feed_cache(rss_url)
+            
+            response = self._fetch_feed(rss_url, timeout or Config.FEED_FETCH_TIMEOUT, cache)
+            if response.status_code == 304:
+                logger.info(f"Feed {category} not modified since last poll")
+                return [], None
+            
+            feed = feedparser.parse(response.content)
             
             jobs = []
+            seen_digests = cache.get('entry_digests', {})
+            entry_digests = {}
+            unchanged = 0
             for entry in feed.entries[:max_jobs]:
+                entry_key = entry.get('id') or entry.get('link', '')
+                digest = self._entry_digest(entry)
+                entry_digests[entry_key] = digest
+                
+                if seen_digests.get(entry_key) == digest:
+                    unchanged += 1
+                    continue
+                
                 try:
                     job = self.parse_job(entry)
                     jobs.append(job)
@@ -37,13 +82,143 @@ class UpworkParser(BasePlatform):
                     logger.warning(f"Failed to parse job entry: {e}")
                     continue
             
-            logger.info(f"Successfully fetched {len(jobs)} jobs from Upwork")
-            return jobs
+            feed_state = {
+                'feed_url': rss_url,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'entry_digests': entry_digests
+            }
             
+            logger.info(f"Successfully fetched {len(jobs)} jobs from Upwork ({unchanged} unchanged)")
+            return jobs, feed_state
+        
         except Exception as e:
             logger.error(f"Error fetching jobs from Upwork: {e}")
             raise JobParsingError(f"Failed to fetch jobs: {e}")
     
+    def fetch_all_jobs(
+        self,
+        categories: Optional[List[str]] = None,
+        max_jobs: int = 20,
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        return self.poll_feeds(categories, max_jobs, max_workers, timeout)[0]
+    
+    def poll_feeds(
+        self,
+        categories: Optional[List[str]] = None,
+        max_jobs: int = 20,
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        categories = categories or list(UPWORK_RSS_FEEDS.keys())
+        
+        if self.circuit_breaker.is_open:
+            logger.warning("Upwork circuit is open, skipping feed fetch")
+            return [], []
+        max_workers = max(1, min(max_workers or Config.FEED_FETCH_CONCURRENCY, len(categories)))
+        
+        logger.info(f"Fetching {len(categories)} Upwork feeds with {max_workers} workers")
+        
+        jobs_by_id: Dict[str, Dict[str, Any]] = {}
+        feed_states: List[Dict[str, Any]] = []
+        failed = 0
+        
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='upwork-feed') as executor:
+            futures = [
+                (category, executor.submit(self.poll_feed, category, max_jobs, timeout))
+                for category in categories
+            ]
+            
+            for category, future in futures:
+                try:
+                    jobs, feed_state = future.result()
+                except Exception as e:
+                    logger.warning(f"Failed to fetch feed {category}: {e}")
+                    failed += 1
+                    continue
+                
+                if feed_state:
+                    feed_states.append(feed_state)
+                for job in jobs:
+                    jobs_by_id.setdefault(job['job_id'], job)
+        
+        if failed == len(categories):
+            raise JobParsingError("Failed to fetch jobs: all feeds failed")
+        
+        logger.info(f"Fetched {len(jobs_by_id)} unique jobs from {len(categories) - failed} feeds")
+        return list(jobs_by_id.values()), feed_states
+    
+    def save_feed_states(self, feed_states: List[Dict[str, Any]]) -> None:
+        for feed_state in feed_states:
+            self._save_feed_cache(feed_state)
+    
+    def _fetch_feed(self, rss_url: str, timeout: float, cache: Dict[str, Any]) -> requests.Response:
+        headers = {}
+        if cache.get('etag'):
+            headers['If-None-Match'] = cache['etag']
+        if cache.get('last_modified'):
+            headers['If-Modified-Since'] = cache['last_modified']
+        
+        with self.circuit_breaker.guard():
+            self.rate_limiter.acquire()
+            response = requests.get(rss_url, headers=headers, timeout=timeout)
+            if response.status_code == 429:
+                self.rate_limiter.update_from_headers(response.headers)
+            if response.status_code != 304:
+                response.raise_for_status()
+        
+        return response
+    
+    def _entry_digest(self, entry: Any) -> str:
+        raw = '\x1f'.join([
+            entry.get('link', ''),
+            entry.get('title', ''),
+            entry.get('summary', ''),
+            entry.get('updated', '')
+        ])
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+    
+    def _load_feed_cache(self, rss_url: str) -> Dict[str, Any]:
+        if not Config.FEED_CACHE_ENABLED:
+            return {}
+        
+        db = Session()
+        try:
+            cache = crud.get_feed_cache(db, rss_url)
+            if not cache:
+                return {}
+            return {
+                'etag': cache.etag,
+                'last_modified': cache.last_modified,
+                'entry_digests': json.loads(cache.entry_digests) if cache.entry_digests else {}
+            }
+        except Exception as e:
+            logger.warning(f"Failed to load feed cache for {rss_url}: {e}")
+            return {}
+        finally:
+            db.close()
+    
+    def _save_feed_cache(self, feed_state: Dict[str, Any]) -> None:
+        if not Config.FEED_CACHE_ENABLED:
+            return
+        
+        db = Session()
+        try:
+            crud.save_feed_cache(
+                db,
+                feed_state['feed_url'],
+                etag=feed_state['etag'],
+                last_modified=feed_state['last_modified'],
+                entry_digests=json.dumps(feed_state['entry_digests'])
+            )
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"Failed to save feed cache for {feed_state['feed_url']}: {e}")
+        finally:
+            db.close()
+    
     def parse_job(self, entry: Any) -> Dict[str, Any]:
         try:
             job_id = self._generate_job_id(entry.link)
@@ -52,8 +227,7 @@ class UpworkParser(BasePlatform):
             
             description = ""
             if hasattr(entry, 'summary'):
-                soup = BeautifulSoup(entry.summary, 'html.parser')
-                description = clean_text(soup.get_text())
+                description = extract_text(entry.summary)
             
             budget = self._extract_budget(description)
             
@@ -67,22 +241,25 @@ class UpworkParser(BasePlatform):
             if hasattr(entry, 'tags'):
                 skills = [tag.term for tag in entry.tags]
             
+            classification = get_job_classifier().classify(title, description)
+            
             job_data = {
                 'job_id': job_id,
                 'title': title,
                 'description': description,
-                'category': self._extract_category(title, description),
+                'category': classification['category'],
                 'budget': budget,
                 'budget_type': 'fixed' if budget else 'hourly',
                 'posted_date': posted_date,
                 'url': job_url,
                 'skills_required': ', '.join(skills) if skills else None,
-                'complexity': self._estimate_complexity(title, description),
+                'complexity': classification['complexity'],
+                'content_hash': content_hash(title, description),
                 'platform': 'upwork'
             }
             
             return job_data
-            
+        
         except Exception as e:
             logger.error(f"Error parsing job: {e}")
             raise JobParsingError(f"Failed to parse job: {e}")
@@ -94,28 +271,7 @@ class UpworkParser(BasePlatform):
         return extract_price_from_text(text)
     
     def _extract_category(self, title: str, description: str) -> str:
-        text = (title + ' ' + description).lower()
-        
-        if any(word in text for word in ['review', 'отзыв']):
-            return 'review'
-        elif any(word in text for word in ['comment', 'комментарий']):
-            return 'comment'
-        elif any(word in text for word in ['feedback', 'обратная связь']):
-            return 'feedback'
-        elif any(word in text for word in ['post', 'пост', 'article', 'статья']):
-            return 'post'
-        else:
-            return 'writing'
+        return get_job_classifier().classify(title, description)['category']
     
     def _estimate_complexity(self, title: str, description: str) -> int:
-        text = (title + ' ' + description).lower()
-        
-        easy_keywords = ['simple', 'quick', 'easy', 'short', 'brief']
-        hard_keywords = ['complex', 'detailed', 'extensive', 'professional', 'expert']
-        
-        if any(word in text for word in easy_keywords):
-            return 1
-        elif any(word in text for word in hard_keywords):
-            return 3
-        else:
-            return 2
+        return get_job_classifier().classify(title, description)['complexity']
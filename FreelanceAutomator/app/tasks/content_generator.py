@@ -1,16 +1,30 @@
+import os
+import socket
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Set
+from app.ai.anthropic_client import get_anthropic_circuit_breaker
 from app.ai.content_generator import ContentGeneratorFactory
 from app.database.session import Session
 from app.database import crud
+from app.core.config import Config
 from app.core.constants import JOB_STATUS
+from app.core.exceptions import CircuitOpenError, LeaseLostError
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 class ContentGenerationTask:
-    def __init__(self):
-        pass
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max(1, max_workers or Config.CONTENT_GENERATION_WORKERS)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight: Set[str] = set()
+        self._lock = threading.Lock()
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.circuit_breaker = get_anthropic_circuit_breaker()
     
-    def generate_for_job(self, job_id: str) -> bool:
+    def generate_for_job(self, job_id: str, claimed: bool = False) -> bool:
         db = Session()
         
         try:
@@ -19,48 +33,116 @@ class ContentGenerationTask:
                 logger.error(f"Job {job_id} not found")
                 return False
             
-            crud.update_job_status(db, job_id, JOB_STATUS['IN_PROGRESS'])
+            title, description, category = job.title, job.description, job.category
             
-            generator = ContentGeneratorFactory.get_generator(job.category)
+            if claimed:
+                if not crud.renew_job_lease(db, job_id, self.worker_id, Config.JOB_LEASE_SECONDS):
+                    logger.warning(f"Lease on job {job_id} was lost while queued, skipping")
+                    return False
+            elif not crud.claim_job(db, job_id, self.worker_id, Config.JOB_LEASE_SECONDS):
+                logger.warning(f"Job {job_id} is leased by another worker, skipping")
+                return False
+            
+            generator = ContentGeneratorFactory.get_generator(category)
             
             generated_text = generator.generate(
-                job_description=f"{job.title}\n\n{job.description}",
+                job_description=f"{title}\n\n{description}",
                 max_tokens=512
             )
             
-            crud.create_generated_content(
-                db,
-                job_id=job.job_id,
-                content_type=job.category,
-                text=generated_text
-            )
-            
-            crud.update_job_status(db, job_id, JOB_STATUS['COMPLETED'])
+            with crud.unit_of_work(db):
+                crud.create_generated_content(
+                    db,
+                    job_id=job_id,
+                    content_type=category,
+                    text=generated_text,
+                    commit=False
+                )
+                if not crud.update_job_status(
+                    db,
+                    job_id,
+                    JOB_STATUS['COMPLETED'],
+                    commit=False,
+                    worker_id=self.worker_id
+                ):
+                    raise LeaseLostError(f"Lease on job {job_id} expired before completion")
             
             logger.info(f"Successfully generated content for job {job_id}")
             return True
-            
+        
+        except LeaseLostError as e:
+            logger.warning(f"Discarding generated content: {e}")
+            return False
+        
         except Exception as e:
+            db.rollback()
+            if isinstance(e, CircuitOpenError) or self.circuit_breaker.is_open:
+                logger.warning(f"LLM backend unavailable, returning job {job_id} to pending: {e}")
+                crud.update_job_status(db, job_id, JOB_STATUS['PENDING'], worker_id=self.worker_id)
+                return False
+            
             logger.error(f"Error generating content for job {job_id}: {e}")
-            crud.update_job_status(db, job_id, JOB_STATUS['FAILED'])
+            crud.update_job_status(db, job_id, JOB_STATUS['FAILED'], worker_id=self.worker_id)
             return False
         
         finally:
             db.close()
     
-    def process_pending_jobs(self, limit: int = 5) -> int:
+    def process_pending_jobs(self, limit: int = 5, wait: bool = True) -> int:
+        if self.circuit_breaker.is_open:
+            logger.warning("LLM circuit is open, leaving pending jobs in the queue")
+            return 0
+        
+        with self._lock:
+            available = max(0, limit - len(self._in_flight))
+        
         db = Session()
         
         try:
-            pending_jobs = crud.get_jobs_by_status(db, JOB_STATUS['PENDING'])
-            
-            processed = 0
-            for job in pending_jobs[:limit]:
-                if self.generate_for_job(job.job_id):
-                    processed += 1
-            
-            logger.info(f"Processed {processed} pending jobs")
-            return processed
-            
+            job_ids = crud.claim_pending_jobs(
+                db,
+                self.worker_id,
+                limit=available,
+                lease_seconds=Config.JOB_LEASE_SECONDS
+            )
         finally:
             db.close()
+        
+        with self._lock:
+            self._in_flight.update(job_ids)
+            executor = self._get_executor()
+        
+        futures = [executor.submit(self._run_job, job_id) for job_id in job_ids]
+        
+        if not wait:
+            logger.info(f"Submitted {len(futures)} pending jobs to {self.max_workers} workers")
+            return len(futures)
+        
+        processed = sum(1 for future in futures if future.result())
+        
+        logger.info(f"Processed {processed} pending jobs")
+        return processed
+    
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        
+        if executor:
+            executor.shutdown(wait=wait, cancel_futures=True)
+            logger.info("Content generation workers stopped")
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix='content-generation'
+            )
+        return self._executor
+    
+    def _run_job(self, job_id: str) -> bool:
+        try:
+            return self.generate_for_job(job_id, claimed=True)
+        finally:
+            with self._lock:
+                self._in_flight.discard(job_id)
+            Session.remove()
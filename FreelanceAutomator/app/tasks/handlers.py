@@ -0,0 +1,59 @@
+from typing import Any, Dict
+from app.core.registry import registry
+from app.database.session import Session
+from app.database import crud
+from app.tasks.queue import TaskError, task_handler
+
+@task_handler('scrape_jobs')
+def scrape_jobs() -> Dict[str, Any]:
+    result = registry.get('job_scraper').run()
+    if result.get('status') == 'error':
+        raise TaskError(result.get('error', 'Scraping failed'))
+    return result
+
+@task_handler('generate_content')
+def generate_content(job_id: str) -> Dict[str, Any]:
+    if not registry.get('content_generation_task').generate_for_job(job_id):
+        raise TaskError(f"Content generation failed for job {job_id}", retryable=False)
+    return {'job_id': job_id}
+
+@task_handler('generate_proposal')
+def generate_proposal(job_id: str, proposal_type: str = 'standard', use_cache: bool = True) -> Dict[str, Any]:
+    db = Session()
+    
+    try:
+        job = crud.get_job_by_id(db, job_id)
+        if not job:
+            raise TaskError(f"Job {job_id} not found", retryable=False)
+        
+        generator = registry.get('proposal_generator')
+        
+        if proposal_type == 'short':
+            proposal_text = generator.generate_short_proposal(
+                job.title,
+                job.description,
+                use_cache=use_cache
+            )
+        else:
+            proposal_text = generator.generate_proposal(
+                job.title,
+                job.description,
+                budget=job.budget,
+                use_cache=use_cache
+            )
+        
+        with crud.unit_of_work(db):
+            proposal = crud.create_proposal(db, job_id, proposal_text, proposal_type, commit=False)
+            db.flush()
+            proposal_id = proposal.id
+        
+        return {
+            'job_id': job_id,
+            'proposal': {
+                'id': proposal_id,
+                'proposal_text': proposal_text,
+                'proposal_type': proposal_type
+            }
+        }
+    finally:
+        db.close()
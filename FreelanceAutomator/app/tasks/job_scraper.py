@@ -1,8 +1,9 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from app.platforms.upwork.parser import UpworkParser
 from app.filters.complexity_filter import ComplexityFilter
 from app.filters.category_filter import CategoryFilter
 from app.filters.price_filter import PriceFilter
+from app.filters.engine import FilterEngine
 from app.database.session import Session
 from app.database import crud
 from app.core.config import Config
@@ -19,46 +20,42 @@ class JobScraper:
             CategoryFilter(Config.TARGET_CATEGORIES),
             PriceFilter(min_price=Config.MIN_JOB_PRICE, max_price=Config.MAX_JOB_PRICE)
         ]
+        self.filter_engine = FilterEngine(self.filters)
     
     def scrape_jobs(self, platform: str = "upwork", max_jobs: int = 20) -> List[Dict[str, Any]]:
+        return self.poll_jobs(platform, max_jobs)[0]
+    
+    def poll_jobs(self, platform: str = "upwork", max_jobs: int = 20) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
         logger.info(f"Starting job scraping from {platform}")
         
         if platform == "upwork":
-            jobs = self.upwork_parser.fetch_jobs(max_jobs=max_jobs)
+            jobs, feed_states = self.upwork_parser.poll_feeds(max_jobs=max_jobs)
         else:
             logger.warning(f"Platform {platform} not supported yet")
-            return []
+            return [], []
         
-        for filter_func in self.filters:
-            jobs = filter_func(jobs)
+        jobs = self.filter_engine.run(jobs).jobs
         
         logger.info(f"After filtering: {len(jobs)} jobs remain")
-        return jobs
+        return jobs, feed_states
     
     def save_jobs_to_db(self, jobs: List[Dict[str, Any]]) -> int:
         db = Session()
-        saved_count = 0
         
         try:
-            for job_data in jobs:
-                existing_job = crud.get_job_by_id(db, job_data['job_id'])
-                
-                if not existing_job:
-                    crud.create_job(db, job_data)
-                    saved_count += 1
-                else:
-                    logger.debug(f"Job {job_data['job_id']} already exists")
+            saved_count = crud.bulk_create_jobs(db, jobs)
             
             logger.info(f"Saved {saved_count} new jobs to database")
             return saved_count
-            
+        
         finally:
             db.close()
     
     def run(self) -> Dict[str, Any]:
         try:
-            jobs = self.scrape_jobs()
+            jobs, feed_states = self.poll_jobs()
             saved_count = self.save_jobs_to_db(jobs)
+            self.upwork_parser.save_feed_states(feed_states)
             
             return {
                 'status': 'success',
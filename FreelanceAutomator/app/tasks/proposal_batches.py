@@ -0,0 +1,101 @@
+from typing import Any, Optional
+from app.ai.proposal_generator import ProposalGenerator
+from app.core.registry import registry
+from app.database.session import Session
+from app.database import crud
+from app.core.config import Config
+from app.core.constants import JOB_STATUS
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+class ProposalBatchTask:
+    def __init__(self, generator: Optional[ProposalGenerator] = None, batch_client: Any = None):
+        self.generator = generator or registry.get('proposal_generator')
+        self.batches = batch_client or self.generator.client
+    
+    def submit_pending(self, limit: Optional[int] = None, proposal_type: str = "standard") -> Optional[str]:
+        limit = limit or Config.PROPOSAL_BATCH_SIZE
+        db = Session()
+        
+        try:
+            open_job_ids = crud.get_open_batch_job_ids(db)
+            jobs = crud.get_jobs_without_proposals(db, limit, exclude_job_ids=open_job_ids, status=JOB_STATUS['PENDING'])
+            
+            if len(jobs) < Config.PROPOSAL_BATCH_MIN_SIZE:
+                logger.info(f"Only {len(jobs)} jobs need proposals, skipping batch submission")
+                return None
+            
+            requests = [
+                {
+                    'custom_id': job.job_id,
+                    'params': self.generator.build_batch_params(
+                        job.title,
+                        job.description,
+                        proposal_type=proposal_type,
+                        budget=job.budget
+                    )
+                }
+                for job in jobs
+            ]
+            
+            batch = self.batches.create_message_batch(requests)
+            crud.create_proposal_batch(db, batch.id, [job.job_id for job in jobs], proposal_type)
+            
+            return batch.id
+        
+        finally:
+            db.close()
+    
+    def poll(self) -> int:
+        db = Session()
+        saved = 0
+        
+        try:
+            for batch in crud.get_open_proposal_batches(db):
+                remote = self.batches.retrieve_message_batch(batch.batch_id)
+                if remote.processing_status != 'ended':
+                    logger.info(f"Proposal batch {batch.batch_id} is {remote.processing_status}")
+                    continue
+                
+                succeeded = errored = 0
+                for entry in self.batches.message_batch_results(batch.batch_id):
+                    if entry.result.type != 'succeeded':
+                        logger.warning(f"Batch request {entry.custom_id} {entry.result.type}")
+                        errored += 1
+                        continue
+                    
+                    try:
+                        proposal_text = self.generator.parse_batch_message(entry.result.message)
+                    except Exception as e:
+                        logger.error(f"Failed to parse batch proposal for job {entry.custom_id}: {e}")
+                        errored += 1
+                        continue
+                    
+                    crud.create_proposal(db, entry.custom_id, proposal_text, batch.proposal_type, commit=False)
+                    succeeded += 1
+                
+                crud.complete_proposal_batch(db, batch, succeeded, errored)
+                saved += succeeded
+            
+            return saved
+        
+        finally:
+            db.close()
+    
+    def run(self) -> dict:
+        try:
+            saved = self.poll()
+            batch_id = self.submit_pending()
+            
+            return {
+                'status': 'success',
+                'proposals_saved': saved,
+                'batch_submitted': batch_id
+            }
+        except Exception as e:
+            logger.error(f"Error in proposal batch processing: {e}")
+            return {
+                'status': 'error',
+                'error': str(e)
+            }
@@ -0,0 +1,177 @@
+import importlib
+import json
+import os
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Optional, Set
+from app.database.session import Session
+from app.database import crud
+from app.core.config import Config
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_handlers: Dict[str, Callable[..., Any]] = {}
+
+class TaskError(Exception):
+    def __init__(self, message: str, retryable: bool = True):
+        super().__init__(message)
+        self.retryable = retryable
+
+def task_handler(name: str):
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        _handlers[name] = func
+        return func
+    return decorator
+
+def get_handler(name: str) -> Optional[Callable[..., Any]]:
+    return _handlers.get(name)
+
+def enqueue(name: str, max_attempts: Optional[int] = None, **payload) -> str:
+    task_id = uuid.uuid4().hex
+    db = Session()
+    
+    try:
+        crud.create_task(
+            db,
+            task_id,
+            name,
+            payload,
+            max_attempts=max_attempts or Config.TASK_MAX_ATTEMPTS
+        )
+    finally:
+        db.close()
+    
+    return task_id
+
+class TaskWorker:
+    def __init__(
+        self,
+        concurrency: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        lease_seconds: Optional[int] = None
+    ):
+        self.concurrency = max(1, concurrency or Config.TASK_WORKER_CONCURRENCY)
+        self.poll_interval = Config.TASK_POLL_INTERVAL if poll_interval is None else poll_interval
+        self.lease_seconds = lease_seconds or Config.TASK_LEASE_SECONDS
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight: Set[str] = set()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_purge = float('-inf')
+        importlib.import_module('app.tasks.handlers')
+    
+    def run_once(self) -> int:
+        with self._lock:
+            available = self.concurrency - len(self._in_flight)
+        if available <= 0:
+            return 0
+        
+        db = Session()
+        try:
+            tasks = crud.claim_tasks(db, self.worker_id, available, self.lease_seconds)
+        finally:
+            db.close()
+        
+        with self._lock:
+            self._in_flight.update(task.task_id for task in tasks)
+            executor = self._get_executor()
+        
+        for task in tasks:
+            executor.submit(self._execute, task)
+        return len(tasks)
+    
+    def run_forever(self) -> None:
+        logger.info(f"Task worker {self.worker_id} started with {self.concurrency} slots")
+        
+        while not self._stopped.is_set():
+            try:
+                claimed = self.run_once()
+                self._purge_if_due()
+            except Exception as e:
+                logger.error(f"Task worker poll failed: {e}")
+                claimed = 0
+            
+            if not claimed:
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+        
+        logger.info(f"Task worker {self.worker_id} stopped")
+    
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.run_forever, name='task-worker', daemon=True)
+            self._thread.start()
+    
+    def stop(self) -> None:
+        self._stopped.set()
+        self._wakeup.set()
+    
+    def shutdown(self, wait: bool = True) -> None:
+        self.stop()
+        
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.poll_interval + 5)
+        
+        with self._lock:
+            executor, self._executor = self._executor, None
+        
+        if executor:
+            executor.shutdown(wait=wait, cancel_futures=True)
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.concurrency,
+                thread_name_prefix='task-worker'
+            )
+        return self._executor
+    
+    def _execute(self, task) -> None:
+        db = Session()
+        
+        try:
+            handler = get_handler(task.name)
+            if handler is None:
+                raise TaskError(f"No handler registered for task {task.name}", retryable=False)
+            
+            result = handler(**json.loads(task.payload or '{}'))
+            crud.complete_task(db, task.task_id, self.worker_id, result)
+            logger.info(f"Task {task.name} ({task.task_id}) succeeded")
+        
+        except Exception as e:
+            db.rollback()
+            retryable = getattr(e, 'retryable', True) and task.attempts < task.max_attempts
+            delay = Config.TASK_RETRY_DELAY_SECONDS * 2 ** (task.attempts - 1) if retryable else None
+            
+            crud.fail_task(db, task.task_id, self.worker_id, str(e), retry_delay=delay)
+            if retryable:
+                logger.warning(f"Task {task.name} ({task.task_id}) failed, retrying in {delay:.0f}s: {e}")
+            else:
+                logger.error(f"Task {task.name} ({task.task_id}) failed: {e}")
+        
+        finally:
+            db.close()
+            Session.remove()
+            with self._lock:
+                self._in_flight.discard(task.task_id)
+            self._wakeup.set()
+    
+    def _purge_if_due(self) -> None:
+        now = time.monotonic()
+        if now - self._last_purge < 3600:
+            return
+        self._last_purge = now
+        
+        db = Session()
+        try:
+            crud.purge_finished_tasks(db, datetime.now(timezone.utc) - timedelta(hours=Config.TASK_RETENTION_HOURS))
+        finally:
+            db.close()
@@ -2,6 +2,7 @@ from apscheduler.schedulers.background import BackgroundScheduler
 from app.tasks.job_scraper import JobScraper
 from app.tasks.content_generator import ContentGenerationTask
 from app.core.config import Config
+from app.core.registry import registry
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -9,8 +10,8 @@ logger = get_logger(__name__)
 class TaskScheduler:
     def __init__(self):
         self.scheduler = BackgroundScheduler()
-        self.job_scraper = JobScraper()
-        self.content_generator = ContentGenerationTask()
+        self.job_scraper = registry.get_or_create('job_scraper', JobScraper)
+        self.content_generator = registry.get_or_create('content_generation_task', ContentGenerationTask)
     
     def scrape_jobs_task(self):
         logger.info("Running scheduled job scraping")
@@ -19,8 +20,16 @@ class TaskScheduler:
     
     def generate_content_task(self):
         logger.info("Running scheduled content generation")
-        processed = self.content_generator.process_pending_jobs(limit=5)
-        logger.info(f"Generated content for {processed} jobs")
+        submitted = self.content_generator.process_pending_jobs(
+            limit=Config.CONTENT_GENERATION_BATCH_SIZE,
+            wait=False
+        )
+        logger.info(f"Queued content generation for {submitted} jobs")
+    
+    def proposal_batches_task(self):
+        logger.info("Running scheduled proposal batch processing")
+        result = registry.get('proposal_batch_task').run()
+        logger.info(f"Proposal batch result: {result}")
     
     def start(self):
         self.scheduler.add_job(
@@ -37,9 +46,18 @@ class TaskScheduler:
             id='generate_content'
         )
         
+        if Config.PROPOSAL_BATCH_ENABLED:
+            self.scheduler.add_job(
+                self.proposal_batches_task,
+                'interval',
+                minutes=Config.PROPOSAL_BATCH_POLL_MINUTES,
+                id='proposal_batches'
+            )
+        
         self.scheduler.start()
         logger.info("Task scheduler started successfully")
     
     def stop(self):
         self.scheduler.shutdown()
+        self.content_generator.shutdown()
         logger.info("Task scheduler stopped")
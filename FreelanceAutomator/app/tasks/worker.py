@@ -0,0 +1,37 @@
+import argparse
+import signal
+from app.core.config import Config
+from app.core.registry import registry, register_default_services
+from app.database.session import init_db
+from app.tasks.queue import TaskWorker
+from app.utils.logger import setup_logger, get_logger
+
+logger = get_logger(__name__)
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the background task worker')
+    parser.add_argument('--concurrency', type=int, default=Config.TASK_WORKER_CONCURRENCY)
+    parser.add_argument('--poll-interval', type=float, default=Config.TASK_POLL_INTERVAL)
+    args = parser.parse_args()
+    
+    setup_logger()
+    init_db()
+    register_default_services(registry)
+    
+    worker = TaskWorker(concurrency=args.concurrency, poll_interval=args.poll_interval)
+    
+    def stop(signum, frame):
+        logger.info(f"Received signal {signum}, stopping task worker")
+        worker.stop()
+    
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+    
+    try:
+        worker.run_forever()
+    finally:
+        worker.shutdown()
+        registry.shutdown()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,32 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+class TTLCache:
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+    
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        now = time.monotonic()
+        
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+            
+            value = factory()
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            return value
+    
+    def invalidate(self, key: Hashable = None) -> None:
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
@@ -0,0 +1,162 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+from app.core.exceptions import CircuitOpenError
+from app.utils.logger import get_logger
+from app.utils.retry import is_rate_limit_error, is_retryable_error
+
+logger = get_logger(__name__)
+
+CIRCUIT_STATES = {
+    'CLOSED': 'closed',
+    'OPEN': 'open',
+    'HALF_OPEN': 'half_open'
+}
+
+def is_backend_failure(error: BaseException) -> bool:
+    return is_retryable_error(error) and not is_rate_limit_error(error)
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 60.0,
+        half_open_max_calls: int = 1,
+        is_failure: Callable[[BaseException], bool] = is_backend_failure
+    ):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = max(1, half_open_max_calls)
+        self.is_failure = is_failure
+        
+        self._state = CIRCUIT_STATES['CLOSED']
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._lock = threading.Lock()
+        
+        self._metrics = {
+            'successes': 0,
+            'failures': 0,
+            'rejected': 0,
+            'opened': 0
+        }
+    
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state(time.monotonic())
+    
+    @property
+    def is_open(self) -> bool:
+        return self.state == CIRCUIT_STATES['OPEN']
+    
+    def before_call(self) -> None:
+        with self._lock:
+            state = self._current_state(time.monotonic())
+            
+            if state == CIRCUIT_STATES['CLOSED']:
+                return
+            
+            if state == CIRCUIT_STATES['HALF_OPEN'] and self._half_open_calls < self.half_open_max_calls:
+                self._half_open_calls += 1
+                return
+            
+            self._metrics['rejected'] += 1
+        
+        raise CircuitOpenError(f"Circuit '{self.name}' is open")
+    
+    def record_success(self) -> None:
+        with self._lock:
+            self._metrics['successes'] += 1
+            self._consecutive_failures = 0
+            if self._state != CIRCUIT_STATES['CLOSED']:
+                logger.info(f"Circuit '{self.name}' closed")
+            self._state = CIRCUIT_STATES['CLOSED']
+            self._half_open_calls = 0
+    
+    def record_failure(self, error: Optional[BaseException] = None) -> None:
+        if error is not None and not self.is_failure(error):
+            self.record_success()
+            return
+        
+        with self._lock:
+            self._metrics['failures'] += 1
+            self._consecutive_failures += 1
+            
+            state = self._current_state(time.monotonic())
+            if state == CIRCUIT_STATES['HALF_OPEN'] or self._consecutive_failures >= self.failure_threshold:
+                self._open()
+    
+    def release(self) -> None:
+        with self._lock:
+            if self._state == CIRCUIT_STATES['HALF_OPEN'] and self._half_open_calls > 0:
+                self._half_open_calls -= 1
+    
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        self.before_call()
+        try:
+            yield
+        except Exception as e:
+            self.record_failure(e)
+            raise
+        except BaseException:
+            self.release()
+            raise
+        self.record_success()
+    
+    def call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        with self.guard():
+            return func(*args, **kwargs)
+    
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'name': self.name,
+                'state': self._current_state(time.monotonic()),
+                'consecutive_failures': self._consecutive_failures,
+                'failure_threshold': self.failure_threshold,
+                'recovery_timeout': self.recovery_timeout,
+                **self._metrics
+            }
+    
+    def _current_state(self, now: float) -> str:
+        if self._state == CIRCUIT_STATES['OPEN'] and now - self._opened_at >= self.recovery_timeout:
+            self._state = CIRCUIT_STATES['HALF_OPEN']
+            self._half_open_calls = 0
+            logger.info(f"Circuit '{self.name}' half-open, probing backend")
+        return self._state
+    
+    def _open(self) -> None:
+        if self._state != CIRCUIT_STATES['OPEN']:
+            self._metrics['opened'] += 1
+            logger.warning(
+                f"Circuit '{self.name}' opened after {self._consecutive_failures} failures, "
+                f"retrying in {self.recovery_timeout}s"
+            )
+        self._state = CIRCUIT_STATES['OPEN']
+        self._opened_at = time.monotonic()
+        self._half_open_calls = 0
+
+_breakers_lock = threading.Lock()
+_breakers: Dict[str, CircuitBreaker] = {}
+
+def get_circuit_breaker(
+    name: str,
+    failure_threshold: int = 5,
+    recovery_timeout: float = 60.0
+) -> CircuitBreaker:
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(name, failure_threshold, recovery_timeout)
+            _breakers[name] = breaker
+        return breaker
+
+def get_all_circuit_breakers() -> Dict[str, CircuitBreaker]:
+    with _breakers_lock:
+        return dict(_breakers)
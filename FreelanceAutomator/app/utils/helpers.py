@@ -1,6 +1,8 @@
+import hashlib
 import re
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
+from app.utils.keywords import get_job_classifier
 
 def clean_text(text: str) -> str:
     text = re.sub(r'\s+', ' ', text)
@@ -16,14 +18,22 @@ def extract_price_from_text(text: str) -> Optional[float]:
     return None
 
 def is_simple_task(title: str, description: str) -> bool:
-    simple_keywords = [
-        'review', 'comment', 'feedback', 'rating',
-        'short', 'simple', 'quick', 'easy',
-        'write a', 'leave a', 'post a'
-    ]
+    return get_job_classifier().classify(title, description)['simple_task']
+
+def content_hash(title: Optional[str], description: Optional[str]) -> str:
+    normalized = clean_text(f"{title or ''}\n{description or ''}").lower()
+    return hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).hexdigest()
+
+def split_skills(skills: Optional[str]) -> List[str]:
+    if not skills:
+        return []
     
-    text = (title + ' ' + description).lower()
-    return any(keyword in text for keyword in simple_keywords)
+    seen = {}
+    for skill in skills.split(','):
+        skill = clean_text(skill).lower()
+        if skill:
+            seen.setdefault(skill, None)
+    return list(seen)
 
 def format_datetime(dt: datetime) -> str:
     return dt.strftime('%Y-%m-%d %H:%M:%S')
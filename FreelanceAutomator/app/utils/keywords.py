@@ -0,0 +1,98 @@
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Mapping, Optional, Sequence, Tuple
+from app.core.constants import (
+    CATEGORY_KEYWORDS,
+    COMPLEXITY_KEYWORDS,
+    DEFAULT_CATEGORY,
+    JOB_COMPLEXITY_LEVELS,
+    SIMPLE_TASK_KEYWORDS
+)
+
+Ruleset = Sequence[Tuple[Any, Iterable[str]]]
+
+class KeywordClassifier:
+    def __init__(self, rulesets: Mapping[str, Ruleset], defaults: Optional[Mapping[str, Any]] = None):
+        self.defaults = dict(defaults or {})
+        self._labels: Dict[str, list] = {}
+        priorities: Dict[str, Dict[str, int]] = {}
+        
+        for name, rules in rulesets.items():
+            self._labels[name] = [label for label, _ in rules]
+            for priority, (_, keywords) in enumerate(rules):
+                for keyword in keywords:
+                    keyword = keyword.lower()
+                    if not keyword:
+                        continue
+                    best = priorities.setdefault(keyword, {})
+                    best[name] = min(best.get(name, priority), priority)
+        
+        self._priorities = _inherit_prefix_priorities(priorities)
+        self._pattern = re.compile(f"(?=({_trie_pattern(priorities)}))") if priorities else None
+    
+    def classify(self, *texts: str) -> Dict[str, Any]:
+        best: Dict[str, int] = {}
+        
+        if self._pattern is not None:
+            text = ' '.join(texts).lower()
+            remaining = len(self._labels)
+            
+            for match in self._pattern.finditer(text):
+                for name, priority in self._priorities[match.group(1)].items():
+                    current = best.get(name)
+                    if current is None or priority < current:
+                        best[name] = priority
+                        if priority == 0:
+                            remaining -= 1
+                if remaining == 0:
+                    break
+        
+        return {
+            name: labels[best[name]] if name in best else self.defaults.get(name)
+            for name, labels in self._labels.items()
+        }
+
+@lru_cache(maxsize=1)
+def get_job_classifier() -> KeywordClassifier:
+    return KeywordClassifier(
+        {
+            'category': CATEGORY_KEYWORDS,
+            'complexity': COMPLEXITY_KEYWORDS,
+            'simple_task': [(True, SIMPLE_TASK_KEYWORDS)]
+        },
+        defaults={
+            'category': DEFAULT_CATEGORY,
+            'complexity': JOB_COMPLEXITY_LEVELS['MEDIUM'],
+            'simple_task': False
+        }
+    )
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    trie: Dict[str, Any] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = None
+    
+    return _node_pattern(trie)
+
+def _node_pattern(node: Dict[str, Any]) -> str:
+    branches = [re.escape(char) + _node_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ''
+    
+    body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+    if '' in node:
+        body = f"(?:{body})?"
+    return body
+
+def _inherit_prefix_priorities(priorities: Dict[str, Dict[str, int]]) -> Dict[str, Dict[str, int]]:
+    merged = {}
+    for keyword, own in priorities.items():
+        combined = dict(own)
+        for end in range(1, len(keyword)):
+            for name, priority in priorities.get(keyword[:end], {}).items():
+                combined[name] = min(combined.get(name, priority), priority)
+        merged[keyword] = combined
+    return merged
@@ -1,29 +1,191 @@
+import asyncio
+import inspect
+import threading
 import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from functools import wraps
+from typing import Dict, Mapping, Optional
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+    
+    def acquire(self, amount: float = 1, timeout: Optional[float] = None) -> bool:
+        wait = self._reserve(amount, timeout)
+        if wait is None:
+            return False
+        if wait > 0:
+            time.sleep(wait)
+        return True
+    
+    async def acquire_async(self, amount: float = 1, timeout: Optional[float] = None) -> bool:
+        wait = self._reserve(amount, timeout)
+        if wait is None:
+            return False
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return True
+    
+    def block_for(self, seconds: float) -> None:
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+    
+    def sync(self, remaining: Optional[float] = None, limit: Optional[float] = None, period: float = 60) -> None:
+        with self._lock:
+            self._refill(time.monotonic())
+            if limit:
+                self.capacity = limit
+                self.rate = limit / period
+            if remaining is not None:
+                self._tokens = min(self._tokens, remaining)
+    
+    @property
+    def available(self) -> float:
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+    
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated_at = now
+    
+    def _reserve(self, amount: float, timeout: Optional[float]) -> Optional[float]:
+        amount = min(amount, self.capacity)
+        
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            
+            deficit = amount - self._tokens
+            wait = deficit / self.rate if deficit > 0 else 0.0
+            wait = max(wait, self._blocked_until - now)
+            
+            if timeout is not None and wait > timeout:
+                return None
+            
+            self._tokens -= amount
+            return wait
+
 class RateLimiter:
     def __init__(self, max_calls: int, period: int):
         self.max_calls = max_calls
         self.period = period
-        self.calls = []
+        self.bucket = TokenBucket(max_calls / period, max_calls)
     
     def __call__(self, func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                await self.bucket.acquire_async()
+                return await func(*args, **kwargs)
+            
+            return async_wrapper
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            now = time.time()
-            
-            self.calls = [call for call in self.calls if call > now - self.period]
-            
-            if len(self.calls) >= self.max_calls:
-                sleep_time = self.period - (now - self.calls[0])
-                logger.warning(f'Rate limit reached. Sleeping for {sleep_time:.2f} seconds')
-                time.sleep(sleep_time)
-                self.calls = []
-            
-            self.calls.append(now)
+            self.bucket.acquire()
             return func(*args, **kwargs)
         
         return wrapper
+
+class AdaptiveRateLimiter:
+    def __init__(self, name: str, requests_per_minute: float, tokens_per_minute: Optional[float] = None):
+        self.name = name
+        self.requests = TokenBucket(requests_per_minute / 60, requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute / 60, tokens_per_minute) if tokens_per_minute else None
+    
+    def acquire(self, tokens: float = 0) -> None:
+        self.requests.acquire()
+        if self.tokens and tokens:
+            self.tokens.acquire(tokens)
+    
+    async def acquire_async(self, tokens: float = 0) -> None:
+        await self.requests.acquire_async()
+        if self.tokens and tokens:
+            await self.tokens.acquire_async(tokens)
+    
+    def update_from_headers(self, headers: Optional[Mapping[str, str]]) -> None:
+        if not headers:
+            return
+        
+        retry_after = parse_retry_after(headers.get('retry-after'))
+        if retry_after:
+            logger.warning(f"{self.name}: server asked to retry after {retry_after:.1f}s")
+            self.requests.block_for(retry_after)
+            if self.tokens:
+                self.tokens.block_for(retry_after)
+        
+        self._sync_bucket(self.requests, headers, 'requests')
+        if self.tokens:
+            prefix = 'input-tokens' if _header(headers, 'input-tokens', 'remaining') is not None else 'tokens'
+            self._sync_bucket(self.tokens, headers, prefix)
+    
+    def _sync_bucket(self, bucket: TokenBucket, headers: Mapping[str, str], kind: str) -> None:
+        remaining = _header(headers, kind, 'remaining')
+        limit = _header(headers, kind, 'limit')
+        if remaining is None and limit is None:
+            return
+        
+        bucket.sync(
+            remaining=float(remaining) if remaining is not None else None,
+            limit=float(limit) if limit is not None else None
+        )
+        
+        if remaining is not None and float(remaining) <= 0:
+            reset_in = _seconds_until(headers.get(f'anthropic-ratelimit-{kind}-reset'))
+            if reset_in:
+                bucket.block_for(reset_in)
+
+_limiters_lock = threading.Lock()
+_limiters: Dict[str, AdaptiveRateLimiter] = {}
+
+def get_rate_limiter(
+    name: str,
+    requests_per_minute: float,
+    tokens_per_minute: Optional[float] = None
+) -> AdaptiveRateLimiter:
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            limiter = AdaptiveRateLimiter(name, requests_per_minute, tokens_per_minute)
+            _limiters[name] = limiter
+        return limiter
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+def rate_limit_headers(error: Exception) -> Optional[Mapping[str, str]]:
+    response = getattr(error, 'response', None)
+    return getattr(response, 'headers', None)
+
+def _header(headers: Mapping[str, str], kind: str, field: str) -> Optional[str]:
+    return headers.get(f'anthropic-ratelimit-{kind}-{field}')
+
+def _seconds_until(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        reset_at = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds())
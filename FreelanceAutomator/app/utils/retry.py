@@ -0,0 +1,156 @@
+import asyncio
+import random
+import time
+from typing import Any, Awaitable, Callable, Iterator, Optional, Tuple, Type
+import anthropic
+import requests
+from app.utils.logger import get_logger
+from app.utils.rate_limiter import parse_retry_after, rate_limit_headers
+
+logger = get_logger(__name__)
+
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504, 529}
+
+RETRYABLE_EXCEPTIONS: Tuple[Type[BaseException], ...] = (
+    anthropic.APIConnectionError,
+    requests.ConnectionError,
+    requests.Timeout,
+    ConnectionError,
+    TimeoutError,
+)
+
+def iter_error_chain(error: BaseException) -> Iterator[BaseException]:
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        yield error
+        error = error.__cause__ or error.__context__
+
+def is_retryable_error(error: BaseException) -> bool:
+    for cause in iter_error_chain(error):
+        if isinstance(cause, RETRYABLE_EXCEPTIONS):
+            return True
+        
+        status_code = getattr(cause, 'status_code', None)
+        if status_code is None:
+            status_code = getattr(getattr(cause, 'response', None), 'status_code', None)
+        if status_code is not None:
+            return status_code in RETRYABLE_STATUS_CODES
+    
+    return False
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    for cause in iter_error_chain(error):
+        if isinstance(cause, anthropic.RateLimitError):
+            return True
+        
+        status_code = getattr(cause, 'status_code', None)
+        if status_code is None:
+            status_code = getattr(getattr(cause, 'response', None), 'status_code', None)
+        if status_code is not None:
+            return status_code == 429
+    
+    return False
+
+def retry_hint(error: BaseException) -> Optional[float]:
+    for cause in iter_error_chain(error):
+        headers = rate_limit_headers(cause)
+        if not headers:
+            continue
+        
+        retry_after_ms = headers.get('retry-after-ms')
+        if retry_after_ms:
+            try:
+                return float(retry_after_ms) / 1000
+            except ValueError:
+                pass
+        
+        hint = parse_retry_after(headers.get('retry-after'))
+        if hint is not None:
+            return hint
+    
+    return None
+
+class RetryPolicy:
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        deadline: Optional[float] = 120.0,
+        classifier: Callable[[BaseException], bool] = is_retryable_error
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.classifier = classifier
+    
+    @classmethod
+    def from_config(cls) -> "RetryPolicy":
+        from app.core.config import Config
+        
+        return cls(
+            max_attempts=Config.RETRY_MAX_ATTEMPTS,
+            base_delay=Config.RETRY_BASE_DELAY,
+            max_delay=Config.RETRY_MAX_DELAY,
+            deadline=Config.RETRY_DEADLINE_SECONDS or None
+        )
+    
+    def with_attempts(self, max_attempts: int) -> "RetryPolicy":
+        return RetryPolicy(max_attempts, self.base_delay, self.max_delay, self.deadline, self.classifier)
+    
+    def compute_delay(self, attempt: int, error: BaseException) -> float:
+        backoff = min(self.max_delay, self.base_delay * (2 ** attempt))
+        delay = random.uniform(0, backoff)
+        
+        hint = retry_hint(error)
+        if hint is not None:
+            delay = max(delay, min(hint, self.max_delay))
+        
+        return delay
+    
+    def call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        started_at = time.monotonic()
+        attempt = 0
+        
+        while True:
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                delay = self._next_delay(attempt, e, started_at)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                attempt += 1
+    
+    async def call_async(self, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        started_at = time.monotonic()
+        attempt = 0
+        
+        while True:
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                delay = self._next_delay(attempt, e, started_at)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+    
+    def _next_delay(self, attempt: int, error: BaseException, started_at: float) -> Optional[float]:
+        if not self.classifier(error):
+            logger.warning(f"Non-retryable error: {error}")
+            return None
+        
+        if attempt + 1 >= self.max_attempts:
+            logger.warning(f"Giving up after {attempt + 1} attempts: {error}")
+            return None
+        
+        delay = self.compute_delay(attempt, error)
+        if self.deadline is not None and time.monotonic() - started_at + delay > self.deadline:
+            logger.warning(f"Retry deadline of {self.deadline}s exceeded: {error}")
+            return None
+        
+        logger.warning(f"Attempt {attempt + 1}/{self.max_attempts} failed, retrying in {delay:.2f}s: {error}")
+        return delay
@@ -0,0 +1,154 @@
+import hashlib
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from html.parser import HTMLParser
+from typing import Dict, List, Optional
+from app.core.config import Config
+from app.utils.helpers import clean_text
+from app.utils.logger import get_logger
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:
+    lxml = None
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    BeautifulSoup = None
+
+logger = get_logger(__name__)
+
+SKIPPED_TAGS = ('script', 'style')
+
+class TextExtractor(ABC):
+    name = 'base'
+    
+    @abstractmethod
+    def extract(self, html: str) -> str:
+        pass
+    
+    def __call__(self, html: str) -> str:
+        return clean_text(self.extract(html)) if html else ''
+
+class LxmlTextExtractor(TextExtractor):
+    name = 'lxml'
+    
+    def extract(self, html: str) -> str:
+        try:
+            root = lxml.html.fragment_fromstring(html, create_parent='div')
+        except etree.ParserError:
+            return ''
+        etree.strip_elements(root, *SKIPPED_TAGS, with_tail=False)
+        return root.text_content()
+
+class _TextCollector(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self._skip_depth = 0
+    
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIPPED_TAGS:
+            self._skip_depth += 1
+    
+    def handle_endtag(self, tag):
+        if tag in SKIPPED_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+    
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+
+class StreamingTextExtractor(TextExtractor):
+    name = 'stream'
+    
+    def extract(self, html: str) -> str:
+        if '<' not in html and '&' not in html:
+            return html
+        
+        collector = _TextCollector()
+        collector.feed(html)
+        collector.close()
+        return ''.join(collector.parts)
+
+class BeautifulSoupTextExtractor(TextExtractor):
+    name = 'bs4'
+    
+    def extract(self, html: str) -> str:
+        return BeautifulSoup(html, 'html.parser').get_text()
+
+class CachedTextExtractor(TextExtractor):
+    def __init__(self, extractor: TextExtractor, max_entries: int = 2048):
+        self.extractor = extractor
+        self.name = f"{extractor.name}+cache"
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def extract(self, html: str) -> str:
+        return self.extractor.extract(html)
+    
+    def __call__(self, html: str) -> str:
+        if not html:
+            return ''
+        
+        key = hashlib.blake2b(html.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        with self._lock:
+            text = self._entries.get(key)
+            if text is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return text
+            self.misses += 1
+        
+        text = self.extractor(html)
+        
+        with self._lock:
+            self._entries[key] = text
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return text
+
+def available_extractors() -> Dict[str, TextExtractor]:
+    extractors: Dict[str, TextExtractor] = {}
+    if lxml is not None:
+        extractors['lxml'] = LxmlTextExtractor()
+    extractors['stream'] = StreamingTextExtractor()
+    if BeautifulSoup is not None:
+        extractors['bs4'] = BeautifulSoupTextExtractor()
+    return extractors
+
+def create_text_extractor(name: Optional[str] = None, cache_size: Optional[int] = None) -> TextExtractor:
+    name = (name or Config.TEXT_EXTRACTOR).lower()
+    cache_size = Config.TEXT_EXTRACTION_CACHE_SIZE if cache_size is None else cache_size
+    extractors = available_extractors()
+    
+    if name == 'auto':
+        extractor = next(iter(extractors.values()))
+    elif name in extractors:
+        extractor = extractors[name]
+    else:
+        logger.warning(f"Text extractor {name} unavailable, falling back to the streaming extractor")
+        extractor = extractors['stream']
+    
+    return CachedTextExtractor(extractor, cache_size) if cache_size > 0 else extractor
+
+_default_extractor: Optional[TextExtractor] = None
+_default_lock = threading.Lock()
+
+def get_text_extractor() -> TextExtractor:
+    global _default_extractor
+    if _default_extractor is None:
+        with _default_lock:
+            if _default_extractor is None:
+                _default_extractor = create_text_extractor()
+                logger.info(f"Using {_default_extractor.name} text extractor")
+    return _default_extractor
+
+def extract_text(html: str) -> str:
+    return get_text_extractor()(html)
@@ -1,15 +1,21 @@
-from flask import Blueprint, render_template, jsonify, request
+import json
+from flask import Blueprint, render_template, jsonify, request, url_for
 from app.database.session import Session
-from app.database import crud
-from app.tasks.job_scraper import JobScraper
-from app.tasks.content_generator import ContentGenerationTask
-from app.core.constants import JOB_STATUS
+from app.database import crud, search
+from app.core.config import Config
+from app.core.constants import JOB_STATUS, TASK_STATUS
+from app.database.models import Job
+from app.tasks.queue import enqueue
+from app.utils.cache import TTLCache
+from app.utils.circuit_breaker import get_all_circuit_breakers
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 main_bp = Blueprint('main', __name__)
 
+stats_cache = TTLCache(Config.STATS_CACHE_SECONDS)
+
 @main_bp.route('/')
 def index():
     return render_template('dashboard.html')
@@ -19,20 +25,21 @@ def get_jobs():
     db = Session()
     try:
         status = request.args.get('status')
-        skip = int(request.args.get('skip', 0))
-        limit = int(request.args.get('limit', 50))
+        skill = request.args.get('skill')
+        cursor = request.args.get('cursor')
         
-        if status:
-            jobs = crud.get_jobs_by_status(db, status)
-        else:
-            jobs = crud.get_all_jobs(db, skip=skip, limit=limit)
+        try:
+            limit = _int_arg('limit', 50, minimum=1, maximum=200)
+            jobs, next_cursor = crud.get_jobs_page(db, status=status, limit=limit, cursor=cursor, skill=skill)
+        except ValueError as e:
+            return jsonify({'status': 'error', 'message': str(e)}), 400
         
         jobs_data = [
             {
                 'id': job.id,
                 'job_id': job.job_id,
                 'title': job.title,
-                'description': job.description[:200] + '...' if len(job.description) > 200 else job.description,
+                'description': job.description + '...' if job.description_truncated else job.description,
                 'category': job.category,
                 'budget': job.budget,
                 'complexity': job.complexity,
@@ -44,7 +51,46 @@ def get_jobs():
             for job in jobs
         ]
         
-        return jsonify({'jobs': jobs_data, 'count': len(jobs_data)})
+        return jsonify({'jobs': jobs_data, 'count': len(jobs_data), 'next_cursor': next_cursor})
+    finally:
+        db.close()
+
+@main_bp.route('/api/jobs/search')
+def search_jobs():
+    query = request.args.get('q', '').strip()
+    if not query:
+        return jsonify({'status': 'error', 'message': 'Query parameter q is required'}), 400
+    
+    try:
+        limit = _int_arg('limit', 20, minimum=1, maximum=100)
+        offset = _int_arg('offset', 0, minimum=0)
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+    
+    db = Session()
+    try:
+        jobs = search.search_jobs(db, query, limit=limit + 1, offset=offset)
+        next_offset = offset + limit if len(jobs) > limit else None
+        
+        jobs_data = [
+            {
+                'id': job.id,
+                'job_id': job.job_id,
+                'title': job.title,
+                'description': job.description + '...' if job.description_truncated else job.description,
+                'category': job.category,
+                'budget': job.budget,
+                'complexity': job.complexity,
+                'status': job.status,
+                'platform': job.platform,
+                'url': job.url,
+                'created_at': job.created_at.isoformat() if job.created_at else None,
+                'rank': job.rank
+            }
+            for job in jobs[:limit]
+        ]
+        
+        return jsonify({'jobs': jobs_data, 'count': len(jobs_data), 'query': query, 'next_offset': next_offset})
     finally:
         db.close()
 
@@ -71,45 +117,97 @@ def get_job_content(job_id):
 @main_bp.route('/api/scrape', methods=['POST'])
 def trigger_scrape():
     try:
-        scraper = JobScraper()
-        result = scraper.run()
-        return jsonify(result)
+        return _accepted(enqueue('scrape_jobs'))
     except Exception as e:
-        logger.error(f"Error in manual scraping: {e}")
+        logger.error(f"Error queueing scraping: {e}")
         return jsonify({'status': 'error', 'error': str(e)}), 500
 
 @main_bp.route('/api/generate/<job_id>', methods=['POST'])
 def trigger_generation(job_id):
     try:
-        generator = ContentGenerationTask()
-        success = generator.generate_for_job(job_id)
-        
-        if success:
-            return jsonify({'status': 'success', 'job_id': job_id})
-        else:
-            return jsonify({'status': 'error', 'message': 'Generation failed'}), 500
+        if not _job_exists(job_id):
+            return jsonify({'status': 'error', 'message': 'Job not found'}), 404
+        return _accepted(enqueue('generate_content', job_id=job_id), job_id=job_id)
     except Exception as e:
-        logger.error(f"Error in manual generation: {e}")
+        logger.error(f"Error queueing generation: {e}")
         return jsonify({'status': 'error', 'error': str(e)}), 500
 
+@main_bp.route('/api/tasks/<task_id>')
+def get_task_status(task_id):
+    db = Session()
+    try:
+        task = crud.get_task(db, task_id)
+        if not task:
+            return jsonify({'status': 'error', 'message': 'Task not found'}), 404
+        
+        return jsonify({
+            'task_id': task.task_id,
+            'name': task.name,
+            'status': task.status,
+            'result': json.loads(task.result) if task.result else None,
+            'error': task.error,
+            'attempts': task.attempts,
+            'max_attempts': task.max_attempts,
+            'created_at': task.created_at.isoformat() if task.created_at else None,
+            'finished_at': task.finished_at.isoformat() if task.finished_at else None
+        })
+    finally:
+        db.close()
+
+def _int_arg(name, default, minimum, maximum=None):
+    value = request.args.get(name)
+    if value is None or value == '':
+        return default
+    try:
+        value = int(value)
+    except ValueError:
+        raise ValueError(f"Query parameter {name} must be an integer")
+    if maximum is not None:
+        value = min(value, maximum)
+    return max(minimum, value)
+
+def _accepted(task_id, **extra):
+    response = jsonify({
+        'status': TASK_STATUS['QUEUED'],
+        'task_id': task_id,
+        'status_url': url_for('main.get_task_status', task_id=task_id),
+        **extra
+    })
+    response.status_code = 202
+    response.headers['Location'] = url_for('main.get_task_status', task_id=task_id)
+    return response
+
+def _job_exists(job_id):
+    db = Session()
+    try:
+        return db.query(Job.id).filter(Job.job_id == job_id).first() is not None
+    finally:
+        db.close()
+
 @main_bp.route('/api/stats')
 def get_stats():
+    return jsonify(stats_cache.get_or_set('job_stats', _compute_stats))
+
+def _compute_stats():
     db = Session()
     try:
-        all_jobs = crud.get_all_jobs(db)
+        counts = crud.count_jobs_by_status(db)
         
-        stats = {
-            'total_jobs': len(all_jobs),
-            'pending': len([j for j in all_jobs if j.status == JOB_STATUS['PENDING']]),
-            'in_progress': len([j for j in all_jobs if j.status == JOB_STATUS['IN_PROGRESS']]),
-            'completed': len([j for j in all_jobs if j.status == JOB_STATUS['COMPLETED']]),
-            'failed': len([j for j in all_jobs if j.status == JOB_STATUS['FAILED']])
+        return {
+            'total_jobs': sum(counts.values()),
+            'pending': counts.get(JOB_STATUS['PENDING'], 0),
+            'in_progress': counts.get(JOB_STATUS['IN_PROGRESS'], 0),
+            'completed': counts.get(JOB_STATUS['COMPLETED'], 0),
+            'failed': counts.get(JOB_STATUS['FAILED'], 0)
         }
-        
-        return jsonify(stats)
     finally:
         db.close()
 
+@main_bp.route('/api/circuits')
+def get_circuits():
+    breakers = get_all_circuit_breakers()
+    return jsonify({'circuits': [breaker.metrics() for breaker in breakers.values()]})
+
 @main_bp.route('/proposals')
 def proposals_page():
     return render_template('proposals.html')
@@ -121,46 +219,19 @@ def settings_page():
 @main_bp.route('/api/proposals/<job_id>', methods=['POST'])
 def generate_proposal(job_id):
     try:
-        from app.ai.proposal_generator import ProposalGenerator
-        from app.database.models import Proposal
+        if not _job_exists(job_id):
+            return jsonify({'status': 'error', 'message': 'Job not found'}), 404
         
-        db = Session()
-        try:
-            job = crud.get_job_by_id(db, job_id)
-            if not job:
-                return jsonify({'status': 'error', 'message': 'Job not found'}), 404
-            
-            data = request.get_json() or {}
-            proposal_type = data.get('type', 'standard')
-            
-            generator = ProposalGenerator()
-            
-            if proposal_type == 'short':
-                proposal_text = generator.generate_short_proposal(job.title, job.description)
-            else:
-                proposal_text = generator.generate_proposal(job.title, job.description, budget=job.budget)
-            
-            proposal = Proposal(
-                job_id=job_id,
-                proposal_text=proposal_text,
-                proposal_type=proposal_type
-            )
-            db.add(proposal)
-            db.commit()
-            
-            return jsonify({
-                'status': 'success',
-                'proposal': {
-                    'id': proposal.id,
-                    'proposal_text': proposal_text,
-                    'proposal_type': proposal_type
-                }
-            })
-        finally:
-            db.close()
-            
+        data = request.get_json(silent=True) or {}
+        task_id = enqueue(
+            'generate_proposal',
+            job_id=job_id,
+            proposal_type=data.get('type', 'standard'),
+            use_cache=not data.get('regenerate', False)
+        )
+        return _accepted(task_id, job_id=job_id)
     except Exception as e:
-        logger.error(f"Error generating proposal: {e}")
+        logger.error(f"Error queueing proposal: {e}")
         return jsonify({'status': 'error', 'error': str(e)}), 500
 
 @main_bp.route('/api/proposals/<job_id>')
@@ -0,0 +1,51 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import feedparser
+from app.utils.text_extraction import CachedTextExtractor, available_extractors
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+def load_summaries(path: str):
+    feed = feedparser.parse(path)
+    return [entry.summary for entry in feed.entries if hasattr(entry, 'summary')]
+
+def time_extractor(extractor, summaries, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for summary in summaries:
+            extractor(summary)
+        best = min(best, time.perf_counter() - started)
+    return best / len(summaries) * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare feed summary text extractors')
+    parser.add_argument('--fixture', default=os.path.join(FIXTURES_DIR, 'upwork_feed.xml'))
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+    
+    summaries = load_summaries(args.fixture)
+    extractors = available_extractors()
+    reference = extractors.get('bs4')
+    
+    print(f"{len(summaries)} summaries from {os.path.basename(args.fixture)}, best of {args.repeat}")
+    print(f"{'extractor':<14}{'us/entry':>10}{'mismatches':>12}")
+    
+    for name, extractor in extractors.items():
+        mismatches = sum(
+            1 for summary in summaries
+            if reference is not None and extractor(summary) != reference(summary)
+        )
+        print(f"{name:<14}{time_extractor(extractor, summaries, args.repeat):>10.1f}{mismatches:>12}")
+    
+    for name, extractor in extractors.items():
+        cached = CachedTextExtractor(extractor, max_entries=len(summaries))
+        print(f"{cached.name:<14}{time_extractor(cached, summaries, args.repeat):>10.1f}{'-':>12}")
+
+if __name__ == '__main__':
+    main()
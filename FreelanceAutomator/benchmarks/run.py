@@ -0,0 +1,324 @@
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(ROOT, 'benchmarks', 'fixtures')
+WORK_DIR = tempfile.mkdtemp(prefix='freelance-bench-')
+
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(WORK_DIR, 'bench.db')}"
+os.environ['GENERATION_CACHE_ENABLED'] = 'False'
+os.environ['TEXT_EXTRACTION_CACHE_SIZE'] = '0'
+os.environ['FEED_CACHE_ENABLED'] = 'False'
+os.environ['STATS_CACHE_SECONDS'] = '0'
+os.environ.setdefault('ANTHROPIC_API_KEY', 'benchmark')
+sys.path.insert(0, ROOT)
+logging.basicConfig(level=logging.WARNING)
+
+@dataclass
+class Benchmark:
+    name: str
+    run: Callable[[], Any]
+    items: int = 1
+    setup: Optional[Callable[[], Any]] = None
+
+BENCHMARKS: Dict[str, Callable[[argparse.Namespace], Benchmark]] = {}
+
+def benchmark(name: str):
+    def decorator(factory):
+        BENCHMARKS[name] = factory
+        return factory
+    return decorator
+
+class StubAnthropicClient:
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+    
+    def generate_with_retry(self, prompt: str, system_prompt: str = "", **kwargs) -> str:
+        self.calls += 1
+        time.sleep(self.latency)
+        return f"Stub response #{self.calls} for a prompt of {len(prompt)} characters."
+
+def load_entries():
+    import feedparser
+    return feedparser.parse(os.path.join(FIXTURES_DIR, 'upwork_feed.xml')).entries
+
+def make_jobs(count: int, prefix: str) -> List[Dict[str, Any]]:
+    rng = random.Random(count)
+    return [
+        {
+            'job_id': f"{prefix}-{i}",
+            'title': f"Write a review {prefix} #{i}",
+            'description': 'Need a short, honest review of our product. ' * rng.randint(1, 20),
+            'category': rng.choice(['review', 'comment', 'feedback', 'post', 'writing']),
+            'budget': rng.choice([None, 5.0, 25.0, 80.0, 300.0, 900.0]),
+            'budget_type': 'fixed',
+            'url': f"https://www.upwork.com/jobs/~{prefix}{i}",
+            'complexity': rng.randint(1, 3),
+            'platform': 'upwork'
+        }
+        for i in range(count)
+    ]
+
+def ensure_database(seed_jobs: int) -> None:
+    from app.database.session import Session, init_db
+    from app.database import crud
+    from app.database.models import Job
+    
+    init_db()
+    db = Session()
+    try:
+        if db.query(Job).count() < seed_jobs:
+            crud.bulk_create_jobs(db, make_jobs(seed_jobs, 'seed'))
+    finally:
+        db.close()
+
+@benchmark('parse_job')
+def bench_parse_job(args) -> Benchmark:
+    from app.platforms.upwork.parser import UpworkParser
+    
+    parser = UpworkParser()
+    entries = load_entries()
+    
+    def run():
+        for entry in entries:
+            parser.parse_job(entry)
+    
+    return Benchmark('parse_job', run, items=len(entries))
+
+@benchmark('text_extraction')
+def bench_text_extraction(args) -> Benchmark:
+    from app.utils.text_extraction import get_text_extractor
+    
+    extractor = get_text_extractor()
+    summaries = [entry.summary for entry in load_entries()]
+    
+    def run():
+        for summary in summaries:
+            extractor(summary)
+    
+    return Benchmark(f"text_extraction[{extractor.name}]", run, items=len(summaries))
+
+@benchmark('filters')
+def bench_filters(args) -> Benchmark:
+    from app.tasks.job_scraper import JobScraper
+    
+    engine = JobScraper().filter_engine
+    jobs = make_jobs(args.jobs * 10, 'filter')
+    
+    return Benchmark('filters', lambda: engine.run(jobs), items=len(jobs))
+
+@benchmark('save_jobs_to_db')
+def bench_save_jobs(args) -> Benchmark:
+    from app.tasks.job_scraper import JobScraper
+    
+    ensure_database(0)
+    scraper = JobScraper()
+    batches = iter(range(1_000_000))
+    state = {}
+    
+    def setup():
+        state['jobs'] = make_jobs(args.jobs, f"save{next(batches)}")
+    
+    return Benchmark(
+        'save_jobs_to_db',
+        lambda: scraper.save_jobs_to_db(state['jobs']),
+        items=args.jobs,
+        setup=setup
+    )
+
+def _api_benchmark(name: str, path: str, args) -> Benchmark:
+    from app import create_app
+    
+    ensure_database(args.jobs)
+    client = create_app().test_client()
+    
+    def run():
+        response = client.get(path)
+        if response.status_code != 200:
+            raise RuntimeError(f"{path} returned {response.status_code}")
+    
+    return Benchmark(name, run)
+
+@benchmark('api_jobs')
+def bench_api_jobs(args) -> Benchmark:
+    return _api_benchmark('api_jobs', '/api/jobs?limit=50', args)
+
+@benchmark('api_stats')
+def bench_api_stats(args) -> Benchmark:
+    return _api_benchmark('api_stats', '/api/stats', args)
+
+@benchmark('content_generation')
+def bench_content_generation(args) -> Benchmark:
+    from app.ai.content_generator import ReviewGenerator
+    from app.core.registry import registry
+    from app.core.constants import JOB_STATUS
+    from app.database.session import Session
+    from app.database import crud
+    from app.database.models import Job
+    from app.tasks.content_generator import ContentGenerationTask
+    
+    ensure_database(0)
+    stub = StubAnthropicClient(args.latency)
+    registry.register('generator:ReviewGenerator', lambda: ReviewGenerator(stub))
+    registry.get('generator:ReviewGenerator')
+    task = ContentGenerationTask()
+    batches = iter(range(1_000_000))
+    count = args.generation_jobs
+    
+    def setup():
+        jobs = make_jobs(count, f"generate{next(batches)}")
+        for job in jobs:
+            job['category'] = 'review'
+        db = Session()
+        try:
+            db.query(Job).filter(Job.status == JOB_STATUS['PENDING']).update(
+                {Job.status: JOB_STATUS['SKIPPED']}, synchronize_session=False
+            )
+            db.commit()
+            crud.bulk_create_jobs(db, jobs)
+        finally:
+            db.close()
+    
+    def run():
+        processed = task.process_pending_jobs(limit=count, wait=True)
+        if processed != count:
+            raise RuntimeError(f"Expected {count} generated jobs, got {processed}")
+    
+    return Benchmark(
+        f"content_generation[{task.max_workers}w,{args.latency * 1000:.0f}ms]",
+        run,
+        items=count,
+        setup=setup
+    )
+
+def measure(bench: Benchmark, repeat: int, warmup: int) -> Dict[str, Any]:
+    timings = []
+    
+    for iteration in range(warmup + repeat):
+        if bench.setup:
+            bench.setup()
+        started = time.perf_counter()
+        bench.run()
+        elapsed = time.perf_counter() - started
+        if iteration >= warmup:
+            timings.append(elapsed)
+    
+    median = statistics.median(timings)
+    return {
+        'repeat': repeat,
+        'items': bench.items,
+        'min': min(timings),
+        'median': median,
+        'mean': statistics.fmean(timings),
+        'stdev': statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        'per_item_us': median / bench.items * 1e6
+    }
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(results: Dict[str, Any], baseline_path: str, threshold: float) -> int:
+    with open(baseline_path) as f:
+        baseline = json.load(f)['results']
+    
+    regressions = 0
+    print(f"\n{'benchmark':<36}{'baseline':>12}{'current':>12}{'change':>10}")
+    
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            print(f"{name:<36}{'-':>12}{current['median'] * 1000:>10.2f}ms{'new':>10}")
+            continue
+        
+        change = current['median'] / previous['median'] - 1
+        flag = ''
+        if change > threshold:
+            regressions += 1
+            flag = ' !'
+        print(
+            f"{name:<36}{previous['median'] * 1000:>10.2f}ms"
+            f"{current['median'] * 1000:>10.2f}ms{change:>+9.1%}{flag}"
+        )
+    
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description='Run FreelanceAutomator performance benchmarks')
+    parser.add_argument('benchmarks', nargs='*', help=f"subset to run: {', '.join(BENCHMARKS)}")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--jobs', type=int, default=1000, help='rows for database and filter benchmarks')
+    parser.add_argument('--generation-jobs', type=int, default=20)
+    parser.add_argument('--latency', type=float, default=0.05, help='stub LLM latency in seconds')
+    parser.add_argument('--output', help='write JSON results to this file')
+    parser.add_argument('--compare', help='baseline JSON results to compare against')
+    parser.add_argument('--threshold', type=float, default=0.10, help='relative slowdown reported as a regression')
+    args = parser.parse_args()
+    
+    unknown = [name for name in args.benchmarks if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+    
+    results = {}
+    print(f"{'benchmark':<36}{'median':>12}{'min':>12}{'per item':>14}")
+    
+    for name in args.benchmarks or BENCHMARKS:
+        bench = BENCHMARKS[name](args)
+        result = measure(bench, args.repeat, args.warmup)
+        results[bench.name] = result
+        print(
+            f"{bench.name:<36}{result['median'] * 1000:>10.2f}ms"
+            f"{result['min'] * 1000:>10.2f}ms{result['per_item_us']:>12.1f}us"
+        )
+    
+    report = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'git_revision': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'options': {
+                'repeat': args.repeat,
+                'jobs': args.jobs,
+                'generation_jobs': args.generation_jobs,
+                'latency': args.latency
+            }
+        },
+        'results': results
+    }
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    
+    regressions = compare(results, args.compare, args.threshold) if args.compare else 0
+    
+    from app import shutdown_services
+    shutdown_services()
+    shutil.rmtree(WORK_DIR, ignore_errors=True)
+    
+    sys.exit(1 if regressions else 0)
+
+if __name__ == '__main__':
+    main()
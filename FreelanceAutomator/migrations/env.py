@@ -0,0 +1,51 @@
+from logging.config import fileConfig
+from alembic import context
+from app.core.config import Config
+from app.database.engine import create_database_engine
+from app.database.migrations import include_name, include_object
+from app.database.session import Base
+import app.database.models
+
+config = context.config
+
+if config.config_file_name is not None and config.attributes.get('configure_logger', True):
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+def _configure(connection=None, **kwargs):
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_name=include_name,
+        include_object=include_object,
+        render_as_batch=True,
+        compare_type=True,
+        **kwargs
+    )
+
+def run_migrations_offline():
+    _configure(url=Config.DATABASE_URL, literal_binds=True, dialect_opts={'paramstyle': 'named'})
+    
+    with context.begin_transaction():
+        context.run_migrations()
+
+def run_migrations_online():
+    connection = config.attributes.get('connection')
+    if connection is not None:
+        _configure(connection)
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+    
+    engine = create_database_engine(Config.DATABASE_URL)
+    with engine.connect() as connection:
+        _configure(connection)
+        with context.begin_transaction():
+            context.run_migrations()
+    engine.dispose()
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,87 @@
+"""baseline schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 17:56:21
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+def _timestamps():
+    return [
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.func.now(), nullable=True)
+    ]
+
+def upgrade():
+    op.create_table(
+        'jobs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('job_id', sa.String(), nullable=True),
+        sa.Column('platform', sa.String(), nullable=True),
+        sa.Column('title', sa.String(), nullable=True),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('category', sa.String(), nullable=True),
+        sa.Column('budget', sa.Float(), nullable=True),
+        sa.Column('budget_type', sa.String(), nullable=True),
+        sa.Column('url', sa.String(), nullable=True),
+        sa.Column('complexity', sa.Integer(), nullable=True),
+        sa.Column('status', sa.String(), nullable=True),
+        sa.Column('posted_date', sa.DateTime(), nullable=True),
+        sa.Column('skills_required', sa.Text(), nullable=True),
+        *_timestamps(),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_jobs_id', 'jobs', ['id'])
+    op.create_index('ix_jobs_job_id', 'jobs', ['job_id'], unique=True)
+    
+    op.create_table(
+        'generated_content',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('job_id', sa.String(), nullable=True),
+        sa.Column('content_type', sa.String(), nullable=True),
+        sa.Column('generated_text', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(['job_id'], ['jobs.job_id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_generated_content_id', 'generated_content', ['id'])
+    op.create_index('ix_generated_content_job_id', 'generated_content', ['job_id'])
+    
+    op.create_table(
+        'proposals',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('job_id', sa.String(), nullable=True),
+        sa.Column('proposal_text', sa.Text(), nullable=True),
+        sa.Column('proposal_type', sa.String(), nullable=True),
+        sa.Column('is_sent', sa.Integer(), nullable=True),
+        sa.Column('sent_at', sa.DateTime(), nullable=True),
+        *_timestamps(),
+        sa.ForeignKeyConstraint(['job_id'], ['jobs.job_id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_proposals_id', 'proposals', ['id'])
+    op.create_index('ix_proposals_job_id', 'proposals', ['job_id'])
+    
+    op.create_table(
+        'user_settings',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('key', sa.String(), nullable=True),
+        sa.Column('value', sa.Text(), nullable=True),
+        *_timestamps(),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_user_settings_id', 'user_settings', ['id'])
+    op.create_index('ix_user_settings_key', 'user_settings', ['key'], unique=True)
+
+def downgrade():
+    op.drop_table('user_settings')
+    op.drop_table('proposals')
+    op.drop_table('generated_content')
+    op.drop_table('jobs')
@@ -0,0 +1,38 @@
+"""feed cache
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 17:41:05
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from app.database.migrations import has_table
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    if has_table('feed_cache'):
+        return
+    
+    op.create_table(
+        'feed_cache',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('feed_url', sa.String(), nullable=True),
+        sa.Column('etag', sa.String(), nullable=True),
+        sa.Column('last_modified', sa.String(), nullable=True),
+        sa.Column('entry_digests', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_feed_cache_id', 'feed_cache', ['id'])
+    op.create_index('ix_feed_cache_feed_url', 'feed_cache', ['feed_url'], unique=True)
+
+def downgrade():
+    op.drop_index('ix_feed_cache_feed_url', table_name='feed_cache')
+    op.drop_index('ix_feed_cache_id', table_name='feed_cache')
+    op.drop_table('feed_cache')
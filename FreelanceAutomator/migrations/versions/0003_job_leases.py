@@ -0,0 +1,25 @@
+"""job leases
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 17:44:52
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from app.database.migrations import has_column
+
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    if not has_column('jobs', 'claimed_by'):
+        op.add_column('jobs', sa.Column('claimed_by', sa.String(), nullable=True))
+    if not has_column('jobs', 'lease_expires_at'):
+        op.add_column('jobs', sa.Column('lease_expires_at', sa.DateTime(), nullable=True))
+
+def downgrade():
+    op.drop_column('jobs', 'lease_expires_at')
+    op.drop_column('jobs', 'claimed_by')
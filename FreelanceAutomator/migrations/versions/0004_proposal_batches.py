@@ -0,0 +1,44 @@
+"""proposal batches
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 17:47:30
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from app.database.migrations import has_table
+
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    if has_table('proposal_batches'):
+        return
+    
+    op.create_table(
+        'proposal_batches',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('batch_id', sa.String(), nullable=True),
+        sa.Column('proposal_type', sa.String(), nullable=True),
+        sa.Column('status', sa.String(), nullable=True),
+        sa.Column('job_ids', sa.Text(), nullable=True),
+        sa.Column('request_count', sa.Integer(), nullable=True),
+        sa.Column('succeeded_count', sa.Integer(), nullable=True),
+        sa.Column('errored_count', sa.Integer(), nullable=True),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_proposal_batches_id', 'proposal_batches', ['id'])
+    op.create_index('ix_proposal_batches_batch_id', 'proposal_batches', ['batch_id'], unique=True)
+    op.create_index('ix_proposal_batches_status', 'proposal_batches', ['status'])
+
+def downgrade():
+    op.drop_index('ix_proposal_batches_status', table_name='proposal_batches')
+    op.drop_index('ix_proposal_batches_batch_id', table_name='proposal_batches')
+    op.drop_index('ix_proposal_batches_id', table_name='proposal_batches')
+    op.drop_table('proposal_batches')
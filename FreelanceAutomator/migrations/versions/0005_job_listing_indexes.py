@@ -0,0 +1,26 @@
+"""job listing indexes
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 17:50:16
+
+"""
+from alembic import op
+from app.database.migrations import has_index
+
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    if has_index('jobs', 'ix_jobs_status'):
+        op.drop_index('ix_jobs_status', table_name='jobs')
+    if not has_index('jobs', 'ix_jobs_status_created_at'):
+        op.create_index('ix_jobs_status_created_at', 'jobs', ['status', 'created_at', 'id'])
+    if not has_index('jobs', 'ix_jobs_created_at_id'):
+        op.create_index('ix_jobs_created_at_id', 'jobs', ['created_at', 'id'])
+
+def downgrade():
+    op.drop_index('ix_jobs_created_at_id', table_name='jobs')
+    op.drop_index('ix_jobs_status_created_at', table_name='jobs')
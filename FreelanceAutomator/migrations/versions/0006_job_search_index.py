@@ -0,0 +1,65 @@
+"""job search index
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 17:53:48
+
+"""
+from alembic import op
+from app.database.migrations import has_table
+
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    
+    if dialect == 'sqlite':
+        rebuild = not has_table('jobs_fts')
+        op.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+                title, description,
+                content='jobs', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2'
+            )
+        """)
+        op.execute("""
+            CREATE TRIGGER IF NOT EXISTS jobs_fts_ai AFTER INSERT ON jobs BEGIN
+                INSERT INTO jobs_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+            END
+        """)
+        op.execute("""
+            CREATE TRIGGER IF NOT EXISTS jobs_fts_ad AFTER DELETE ON jobs BEGIN
+                INSERT INTO jobs_fts(jobs_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+            END
+        """)
+        op.execute("""
+            CREATE TRIGGER IF NOT EXISTS jobs_fts_au AFTER UPDATE OF title, description ON jobs BEGIN
+                INSERT INTO jobs_fts(jobs_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+                INSERT INTO jobs_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+            END
+        """)
+        if rebuild:
+            op.execute("INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')")
+    elif dialect == 'postgresql':
+        op.execute("""
+            ALTER TABLE jobs ADD COLUMN IF NOT EXISTS search_vector tsvector
+                GENERATED ALWAYS AS (
+                    setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+                    setweight(to_tsvector('simple', coalesce(description, '')), 'B')
+                ) STORED
+        """)
+        op.execute("CREATE INDEX IF NOT EXISTS ix_jobs_search_vector ON jobs USING GIN (search_vector)")
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    
+    if dialect == 'sqlite':
+        for trigger in ('jobs_fts_ai', 'jobs_fts_ad', 'jobs_fts_au'):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS jobs_fts")
+    elif dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_jobs_search_vector")
+        op.execute("ALTER TABLE jobs DROP COLUMN IF EXISTS search_vector")
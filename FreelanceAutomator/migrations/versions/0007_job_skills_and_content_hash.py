@@ -0,0 +1,96 @@
+"""job skills and content hash
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 18:04:12
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from app.database.migrations import indexes_on
+from app.utils.helpers import content_hash, split_skills
+
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+jobs = sa.table(
+    'jobs',
+    sa.column('id', sa.Integer),
+    sa.column('job_id', sa.String),
+    sa.column('title', sa.String),
+    sa.column('description', sa.Text),
+    sa.column('skills_required', sa.Text),
+    sa.column('content_hash', sa.String)
+)
+
+job_skills = sa.table(
+    'job_skills',
+    sa.column('job_id', sa.String),
+    sa.column('skill', sa.String)
+)
+
+def upgrade():
+    op.add_column('jobs', sa.Column('content_hash', sa.String(length=32), nullable=True))
+    op.create_index('ix_jobs_content_hash', 'jobs', ['content_hash'])
+    op.create_index('ix_jobs_status_lease_expires_at', 'jobs', ['status', 'lease_expires_at'])
+    
+    op.create_table(
+        'job_skills',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('job_id', sa.String(), nullable=False),
+        sa.Column('skill', sa.String(), nullable=False),
+        sa.ForeignKeyConstraint(['job_id'], ['jobs.job_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('job_id', 'skill', name='uq_job_skills_job_id_skill')
+    )
+    op.create_index('ix_job_skills_skill_job_id', 'job_skills', ['skill', 'job_id'])
+    
+    for index in indexes_on('proposals', ['job_id']):
+        op.drop_index(index, table_name='proposals')
+    op.create_index('ix_proposals_job_id_is_sent', 'proposals', ['job_id', 'is_sent'])
+    
+    _backfill()
+
+def downgrade():
+    op.drop_index('ix_proposals_job_id_is_sent', table_name='proposals')
+    op.create_index('ix_proposals_job_id', 'proposals', ['job_id'])
+    
+    op.drop_index('ix_job_skills_skill_job_id', table_name='job_skills')
+    op.drop_table('job_skills')
+    
+    op.drop_index('ix_jobs_status_lease_expires_at', table_name='jobs')
+    op.drop_index('ix_jobs_content_hash', table_name='jobs')
+    op.drop_column('jobs', 'content_hash')
+
+def _backfill():
+    connection = op.get_bind()
+    last_id = 0
+    
+    while True:
+        rows = connection.execute(
+            sa.select(jobs.c.id, jobs.c.job_id, jobs.c.title, jobs.c.description, jobs.c.skills_required)
+            .where(jobs.c.id > last_id)
+            .order_by(jobs.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        
+        connection.execute(
+            jobs.update().where(jobs.c.id == sa.bindparam('row_id')).values(content_hash=sa.bindparam('hash')),
+            [{'row_id': row.id, 'hash': content_hash(row.title, row.description)} for row in rows]
+        )
+        
+        skill_rows = [
+            {'job_id': row.job_id, 'skill': skill}
+            for row in rows
+            for skill in split_skills(row.skills_required)
+        ]
+        if skill_rows:
+            connection.execute(job_skills.insert(), skill_rows)
+        
+        last_id = rows[-1].id
@@ -0,0 +1,42 @@
+"""task queue
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 20:41:37
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        'tasks',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('task_id', sa.String(length=32), nullable=True),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('payload', sa.Text(), nullable=True),
+        sa.Column('status', sa.String(), nullable=True),
+        sa.Column('result', sa.Text(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('attempts', sa.Integer(), nullable=True),
+        sa.Column('max_attempts', sa.Integer(), nullable=True),
+        sa.Column('run_after', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.Column('claimed_by', sa.String(), nullable=True),
+        sa.Column('lease_expires_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_tasks_task_id', 'tasks', ['task_id'], unique=True)
+    op.create_index('ix_tasks_status_run_after', 'tasks', ['status', 'run_after', 'id'])
+
+def downgrade():
+    op.drop_index('ix_tasks_status_run_after', table_name='tasks')
+    op.drop_index('ix_tasks_task_id', table_name='tasks')
+    op.drop_table('tasks')
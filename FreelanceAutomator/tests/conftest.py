@@ -0,0 +1,17 @@
+import pytest
+from app.database import session as db_session
+from app.database.engine import create_database_engine
+from app.database.migrations import upgrade_database
+
+@pytest.fixture
+def migrated_engine(tmp_path):
+    engine = create_database_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    upgrade_database(engine)
+    
+    db_session.Session.remove()
+    db_session.Session.configure(bind=engine)
+    yield engine
+    
+    db_session.Session.remove()
+    db_session.Session.configure(bind=db_session.engine)
+    engine.dispose()
@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta, timezone
+import pytest
+from app.core.constants import JOB_STATUS
+from app.database import crud
+from app.database.models import Job
+from app.database.session import Session
+from app.tasks import content_generator
+from app.tasks.content_generator import ContentGenerationTask
+
+class FakeGenerator:
+    def generate(self, job_description, max_tokens):
+        return f"Generated for {job_description.splitlines()[0]}"
+
+@pytest.fixture
+def task(migrated_engine, monkeypatch):
+    monkeypatch.setattr(content_generator.ContentGeneratorFactory, 'get_generator', staticmethod(lambda category: FakeGenerator()))
+    task = ContentGenerationTask(max_workers=1)
+    yield task
+    task.shutdown()
+
+@pytest.fixture
+def jobs(migrated_engine):
+    db = Session()
+    try:
+        crud.bulk_create_jobs(db, [
+            {'job_id': f"job-{i}", 'title': f"Review {i}", 'description': 'Details', 'category': 'review', 'status': JOB_STATUS['PENDING']}
+            for i in range(3)
+        ])
+    finally:
+        db.close()
+
+def _set_lease(job_id, **values):
+    db = Session()
+    try:
+        db.query(Job).filter(Job.job_id == job_id).update(values)
+        db.commit()
+    finally:
+        db.close()
+
+def _job(job_id):
+    db = Session()
+    try:
+        job = crud.get_job_by_id(db, job_id)
+        return job.status, job.claimed_by, len(crud.get_content_by_job_id(db, job_id))
+    finally:
+        db.close()
+
+def _claim(task, limit):
+    db = Session()
+    try:
+        return crud.claim_pending_jobs(db, task.worker_id, limit=limit, lease_seconds=60)
+    finally:
+        db.close()
+
+def test_queued_job_with_expired_lease_is_renewed(task, jobs):
+    [job_id] = _claim(task, 1)
+    _set_lease(job_id, lease_expires_at=datetime.now(timezone.utc) - timedelta(seconds=1))
+    
+    assert task._run_job(job_id)
+    assert _job(job_id) == (JOB_STATUS['COMPLETED'], None, 1)
+
+def test_queued_job_taken_by_another_worker_is_skipped(task, jobs):
+    [job_id] = _claim(task, 1)
+    _set_lease(job_id, claimed_by='other-worker')
+    
+    assert not task._run_job(job_id)
+    assert _job(job_id) == (JOB_STATUS['IN_PROGRESS'], 'other-worker', 0)
+
+def test_renew_job_lease_requires_current_owner(task, jobs):
+    [job_id] = _claim(task, 1)
+    db = Session()
+    try:
+        assert crud.renew_job_lease(db, job_id, task.worker_id, 600)
+        assert not crud.renew_job_lease(db, job_id, 'other-worker', 600)
+        assert not crud.renew_job_lease(db, 'job-2', task.worker_id, 600)
+    finally:
+        db.close()
+
+def test_process_pending_jobs_generates_all_claimed_jobs(task, jobs):
+    assert task.process_pending_jobs(limit=3) == 3
+    assert all(_job(f"job-{i}") == (JOB_STATUS['COMPLETED'], None, 1) for i in range(3))
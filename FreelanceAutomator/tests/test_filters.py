@@ -0,0 +1,58 @@
+import random
+import pytest
+from app.filters.base_filter import BaseFilter
+from app.filters.category_filter import CategoryFilter
+from app.filters.complexity_filter import ComplexityFilter
+from app.filters.engine import FilterEngine
+from app.filters.price_filter import PriceFilter
+
+class TitleFilter(BaseFilter):
+    def matches(self, job):
+        return 'review' in job['title'].lower()
+
+def _filters():
+    return [
+        ComplexityFilter(max_complexity=2),
+        CategoryFilter(['review', 'writing']),
+        PriceFilter(min_price=10, max_price=500)
+    ]
+
+def _jobs(count=2000):
+    rng = random.Random(7)
+    return [
+        {
+            'job_id': str(i),
+            'title': rng.choice(['Review app', 'Write post', 'Fix bug']),
+            'category': rng.choice(['review', 'Writing', 'coding', None]),
+            'complexity': rng.randint(1, 4),
+            'budget': rng.choice([None, 5.0, 50.0, 250.0, 900.0])
+        }
+        for i in range(count)
+    ]
+
+def test_filters_declare_columnar_support():
+    assert all(f.supports_columnar for f in _filters())
+    assert TitleFilter.supports_columnar is False
+    assert TitleFilter().mask(None) is None
+
+def test_columnar_mode_matches_row_mode():
+    pytest.importorskip('numpy')
+    engine = FilterEngine(_filters())
+    jobs = _jobs()
+    
+    rows = engine.run(jobs, columnar=False)
+    columnar = engine.run(jobs, columnar=True)
+    
+    assert engine.columnar_available
+    assert columnar.mode == 'columnar'
+    assert [job['job_id'] for job in columnar.jobs] == [job['job_id'] for job in rows.jobs]
+    assert columnar.rejected == rows.rejected
+
+def test_filter_without_columnar_support_uses_row_mode():
+    engine = FilterEngine(_filters() + [TitleFilter()], columnar_threshold=0)
+    
+    result = engine.run(_jobs(200), columnar=True)
+    
+    assert not engine.columnar_available
+    assert result.mode == 'row'
+    assert all('review' in job['title'].lower() for job in result.jobs)
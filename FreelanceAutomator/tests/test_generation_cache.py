@@ -0,0 +1,62 @@
+import pytest
+from app.ai import generation_cache
+from app.ai.generation_cache import MemoryGenerationCache, SQLiteGenerationCache, TieredGenerationCache
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+    
+    def time(self):
+        return self.now
+    
+    def monotonic(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(generation_cache, 'time', clock)
+    return clock
+
+@pytest.fixture
+def disk(tmp_path, clock):
+    cache = SQLiteGenerationCache(str(tmp_path / 'cache.db'), ttl_seconds=100)
+    yield cache
+    cache.close()
+
+def test_promoted_entry_keeps_remaining_ttl(clock, disk):
+    disk.set('key', 'value')
+    clock.now += 80
+    
+    memory = MemoryGenerationCache(ttl_seconds=100)
+    tiered = TieredGenerationCache([memory, disk])
+    
+    assert tiered.get('key') == 'value'
+    assert memory.get_entry('key') == ('value', pytest.approx(20))
+    
+    clock.now += 30
+    assert memory.get('key') is None
+    assert tiered.get('key') is None
+
+def test_set_with_ttl_is_capped_by_tier_ttl(clock, disk):
+    memory = MemoryGenerationCache(ttl_seconds=100)
+    memory.set('key', 'value', 500)
+    disk.set('key', 'value', 40)
+    
+    assert memory.get_entry('key') == ('value', pytest.approx(100))
+    assert disk.get_entry('key') == ('value', pytest.approx(40))
+
+def test_entries_without_ttl_never_expire(clock):
+    memory = MemoryGenerationCache()
+    memory.set('key', 'value')
+    clock.now += 10 ** 6
+    
+    assert memory.get_entry('key') == ('value', None)
+
+def test_tiered_stats_count_hits_and_misses(clock, disk):
+    tiered = TieredGenerationCache([MemoryGenerationCache(ttl_seconds=100), disk])
+    tiered.set('key', 'value')
+    
+    assert tiered.get('key') == 'value'
+    assert tiered.get('missing') is None
+    assert (tiered.hits, tiered.misses) == (1, 1)
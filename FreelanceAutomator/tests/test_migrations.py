@@ -0,0 +1,189 @@
+import pytest
+import sqlalchemy as sa
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy.orm import sessionmaker
+from app.database import crud
+from app.database.engine import create_database_engine
+from app.database.migrations import (
+    current_revision,
+    get_alembic_config,
+    head_revision,
+    include_name,
+    include_object,
+    upgrade_database
+)
+from app.database.session import Base
+import app.database.models
+
+def _timestamps():
+    return [
+        sa.Column('created_at', sa.DateTime, server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime, server_default=sa.func.now(), onupdate=sa.func.now())
+    ]
+
+def baseline_metadata(pre_alembic_series=False):
+    metadata = sa.MetaData()
+    
+    job_columns = [
+        sa.Column('id', sa.Integer, primary_key=True, index=True),
+        sa.Column('job_id', sa.String, unique=True, index=True),
+        sa.Column('platform', sa.String, default='upwork'),
+        sa.Column('title', sa.String),
+        sa.Column('description', sa.Text),
+        sa.Column('category', sa.String),
+        sa.Column('budget', sa.Float, nullable=True),
+        sa.Column('budget_type', sa.String, nullable=True),
+        sa.Column('url', sa.String, nullable=True),
+        sa.Column('complexity', sa.Integer, default=1),
+        sa.Column('status', sa.String, default='pending', index=pre_alembic_series),
+        sa.Column('posted_date', sa.DateTime, nullable=True),
+        sa.Column('skills_required', sa.Text, nullable=True)
+    ]
+    if pre_alembic_series:
+        job_columns += [
+            sa.Column('claimed_by', sa.String, nullable=True),
+            sa.Column('lease_expires_at', sa.DateTime, nullable=True)
+        ]
+    sa.Table('jobs', metadata, *job_columns, *_timestamps())
+    
+    sa.Table(
+        'generated_content', metadata,
+        sa.Column('id', sa.Integer, primary_key=True, index=True),
+        sa.Column('job_id', sa.String, sa.ForeignKey('jobs.job_id'), index=True),
+        sa.Column('content_type', sa.String),
+        sa.Column('generated_text', sa.Text),
+        sa.Column('created_at', sa.DateTime, server_default=sa.func.now())
+    )
+    
+    sa.Table(
+        'proposals', metadata,
+        sa.Column('id', sa.Integer, primary_key=True, index=True),
+        sa.Column('job_id', sa.String, sa.ForeignKey('jobs.job_id'), index=True),
+        sa.Column('proposal_text', sa.Text),
+        sa.Column('proposal_type', sa.String, default='standard'),
+        sa.Column('is_sent', sa.Integer, default=0),
+        sa.Column('sent_at', sa.DateTime, nullable=True),
+        *_timestamps()
+    )
+    
+    sa.Table(
+        'user_settings', metadata,
+        sa.Column('id', sa.Integer, primary_key=True, index=True),
+        sa.Column('key', sa.String, unique=True, index=True),
+        sa.Column('value', sa.Text),
+        *_timestamps()
+    )
+    
+    if pre_alembic_series:
+        sa.Table(
+            'feed_cache', metadata,
+            sa.Column('id', sa.Integer, primary_key=True, index=True),
+            sa.Column('feed_url', sa.String, unique=True, index=True),
+            sa.Column('etag', sa.String, nullable=True),
+            sa.Column('last_modified', sa.String, nullable=True),
+            sa.Column('entry_digests', sa.Text, nullable=True),
+            *_timestamps()
+        )
+    
+    return metadata
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_database_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    yield engine
+    engine.dispose()
+
+def _seed(engine, metadata):
+    metadata.create_all(engine)
+    jobs = metadata.tables['jobs']
+    proposals = metadata.tables['proposals']
+    
+    with engine.begin() as conn:
+        conn.execute(jobs.insert(), [
+            {
+                'job_id': 'legacy-1',
+                'title': 'Review my landing page',
+                'description': 'Need honest feedback on copy',
+                'status': 'pending',
+                'skills_required': 'Copywriting, UX'
+            },
+            {
+                'job_id': 'legacy-2',
+                'title': 'Write product descriptions',
+                'description': 'Ten short descriptions',
+                'status': 'completed',
+                'skills_required': None
+            }
+        ])
+        conn.execute(proposals.insert(), [{'job_id': 'legacy-1', 'proposal_text': 'Hello'}])
+
+def _schema_diff(engine):
+    with engine.connect() as conn:
+        context = MigrationContext.configure(conn, opts={
+            'include_name': include_name,
+            'include_object': include_object,
+            'compare_type': True
+        })
+        return compare_metadata(context, Base.metadata)
+
+@pytest.mark.parametrize('pre_alembic_series', [False, True])
+def test_upgrade_unversioned_database(engine, pre_alembic_series):
+    _seed(engine, baseline_metadata(pre_alembic_series))
+    
+    assert upgrade_database(engine) is True
+    assert current_revision(engine) == head_revision()
+    assert _schema_diff(engine) == []
+    
+    db = sessionmaker(bind=engine)()
+    try:
+        assert crud.claim_pending_jobs(db, 'worker-1', 10, 60) == ['legacy-1']
+        
+        job = crud.get_job_by_id(db, 'legacy-1')
+        assert job.content_hash
+        assert sorted(skill.skill for skill in job.skills) == ['copywriting', 'ux']
+        assert len(job.proposals) == 1
+        
+        matches = db.execute(sa.text("SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH 'landing'")).all()
+        assert [row.rowid for row in matches] == [job.id]
+    finally:
+        db.close()
+
+@pytest.mark.parametrize('legacy_index', [None, 'proposals_job_idx'])
+def test_upgrade_replaces_proposal_job_index(engine, legacy_index):
+    _seed(engine, baseline_metadata())
+    with engine.begin() as conn:
+        conn.execute(sa.text("DROP INDEX ix_proposals_job_id"))
+        if legacy_index:
+            conn.execute(sa.text(f"CREATE INDEX {legacy_index} ON proposals (job_id)"))
+    
+    upgrade_database(engine)
+    
+    assert {i['name'] for i in sa.inspect(engine).get_indexes('proposals')} == {
+        'ix_proposals_id',
+        'ix_proposals_job_id_is_sent'
+    }
+    assert _schema_diff(engine) == []
+
+def test_upgrade_empty_database(engine):
+    assert upgrade_database(engine) is False
+    assert current_revision(engine) == head_revision()
+    assert _schema_diff(engine) == []
+
+def test_downgrade_to_baseline_and_back(engine):
+    _seed(engine, baseline_metadata())
+    upgrade_database(engine)
+    
+    alembic_config = get_alembic_config()
+    with engine.begin() as conn:
+        alembic_config.attributes['connection'] = conn
+        command.downgrade(alembic_config, '0001')
+    
+    assert current_revision(engine) == '0001'
+    assert {c['name'] for c in sa.inspect(engine).get_columns('jobs')} == {
+        c.name for c in baseline_metadata().tables['jobs'].columns
+    }
+    
+    upgrade_database(engine)
+    assert _schema_diff(engine) == []
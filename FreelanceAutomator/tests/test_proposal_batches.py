@@ -0,0 +1,160 @@
+from types import SimpleNamespace
+from unittest import mock
+import pytest
+from app.ai.anthropic_client import AnthropicClient
+from app.ai.proposal_generator import ProposalGenerator
+from app.core.config import Config
+from app.core.constants import JOB_STATUS
+from app.database import crud
+from app.database.models import ProposalBatch
+from app.database.session import Session
+from app.tasks.proposal_batches import ProposalBatchTask
+
+class FakeBatches:
+    def __init__(self):
+        self.created = []
+        self.processing_status = 'in_progress'
+        self.results = []
+    
+    def create_message_batch(self, requests):
+        self.created.append(requests)
+        return SimpleNamespace(id=f"msgbatch_{len(self.created)}")
+    
+    def retrieve_message_batch(self, batch_id):
+        return SimpleNamespace(id=batch_id, processing_status=self.processing_status)
+    
+    def message_batch_results(self, batch_id):
+        return self.results
+
+def _message(text):
+    return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+def _succeeded(job_id, text):
+    return SimpleNamespace(custom_id=job_id, result=SimpleNamespace(type='succeeded', message=_message(text)))
+
+def _errored(job_id):
+    return SimpleNamespace(custom_id=job_id, result=SimpleNamespace(type='errored'))
+
+@pytest.fixture
+def task(migrated_engine, monkeypatch):
+    monkeypatch.setattr(Config, 'PROPOSAL_BATCH_MIN_SIZE', 1)
+    generator = ProposalGenerator(AnthropicClient(api_key='test-key', cache=None))
+    return ProposalBatchTask(generator=generator, batch_client=FakeBatches())
+
+@pytest.fixture
+def jobs(migrated_engine):
+    db = Session()
+    try:
+        crud.bulk_create_jobs(db, [
+            {'job_id': job_id, 'title': f"Review task {job_id}", 'description': f"Details for {job_id}", 'status': status}
+            for job_id, status in [
+                ('pending-1', JOB_STATUS['PENDING']),
+                ('pending-2', JOB_STATUS['PENDING']),
+                ('pending-3', JOB_STATUS['PENDING']),
+                ('leased', JOB_STATUS['IN_PROGRESS']),
+                ('completed', JOB_STATUS['COMPLETED']),
+                ('failed', JOB_STATUS['FAILED'])
+            ]
+        ])
+        crud.create_proposal(db, 'pending-3', 'Existing proposal')
+    finally:
+        db.close()
+
+def _batches():
+    db = Session()
+    try:
+        return db.query(ProposalBatch).all()
+    finally:
+        db.close()
+
+def test_submit_pending_only_sends_pending_jobs_without_proposals(task, jobs):
+    batch_id = task.submit_pending()
+    
+    assert batch_id == 'msgbatch_1'
+    [requests] = task.batches.created
+    assert [request['custom_id'] for request in requests] == ['pending-1', 'pending-2']
+    assert 'Review task pending-1' in requests[0]['params']['messages'][0]['content']
+    
+    [batch] = _batches()
+    assert batch.status == 'in_progress'
+    assert batch.request_count == 2
+
+def test_submit_pending_skips_jobs_already_in_an_open_batch(task, jobs):
+    task.submit_pending()
+    
+    assert task.submit_pending() is None
+    assert len(task.batches.created) == 1
+
+def test_submit_pending_below_minimum_size(task, jobs, monkeypatch):
+    monkeypatch.setattr(Config, 'PROPOSAL_BATCH_MIN_SIZE', 5)
+    
+    assert task.submit_pending() is None
+    assert task.batches.created == []
+    assert _batches() == []
+
+def test_poll_ingests_results_once_batch_has_ended(task, jobs):
+    task.submit_pending()
+    
+    assert task.poll() == 0
+    assert _batches()[0].status == 'in_progress'
+    
+    task.batches.processing_status = 'ended'
+    task.batches.results = [_succeeded('pending-1', 'Proposal for one'), _errored('pending-2')]
+    
+    assert task.poll() == 1
+    
+    [batch] = _batches()
+    assert (batch.status, batch.succeeded_count, batch.errored_count) == ('ended', 1, 1)
+    assert batch.completed_at is not None
+    
+    db = Session()
+    try:
+        assert [p.proposal_text for p in crud.get_proposals_by_job_id(db, 'pending-1')] == ['Proposal for one']
+        assert crud.get_proposals_by_job_id(db, 'pending-2') == []
+    finally:
+        db.close()
+    
+    assert task.poll() == 0
+
+def test_poll_rolls_back_proposals_when_batch_completion_fails(task, jobs):
+    task.submit_pending()
+    task.batches.processing_status = 'ended'
+    task.batches.results = [_succeeded('pending-1', 'Proposal for one'), _succeeded('pending-2', 'Proposal for two')]
+    
+    with mock.patch.object(crud, 'complete_proposal_batch', side_effect=RuntimeError('disk full')):
+        with pytest.raises(RuntimeError):
+            task.poll()
+    
+    db = Session()
+    try:
+        assert crud.get_proposals_by_job_id(db, 'pending-1') == []
+        assert crud.get_proposals_by_job_id(db, 'pending-2') == []
+    finally:
+        db.close()
+    assert _batches()[0].status == 'in_progress'
+    
+    assert task.poll() == 2
+    assert _batches()[0].status == 'ended'
+
+def test_run_reports_errors_instead_of_raising(task, jobs):
+    task.batches.create_message_batch = mock.Mock(side_effect=RuntimeError('unavailable'))
+    
+    result = task.run()
+    
+    assert result == {'status': 'error', 'error': 'unavailable'}
+    assert _batches() == []
+
+def test_client_batch_calls_go_through_breaker_and_rate_limiter():
+    client = AnthropicClient(api_key='test-key', cache=None)
+    client.client = mock.Mock()
+    client.rate_limiter = mock.Mock()
+    client.circuit_breaker = mock.MagicMock()
+    raw = client.client.messages.batches.with_raw_response.create.return_value
+    raw.parse.return_value = SimpleNamespace(id='msgbatch_1')
+    
+    batch = client.create_message_batch([{'custom_id': 'job-1', 'params': {}}])
+    
+    assert batch.id == 'msgbatch_1'
+    client.circuit_breaker.guard.assert_called_once_with()
+    client.rate_limiter.acquire.assert_called_once_with()
+    client.rate_limiter.update_from_headers.assert_called_once_with(raw.headers)
@@ -0,0 +1,49 @@
+import pytest
+from app.core.registry import ServiceRegistry
+
+class Service:
+    def __init__(self, label='default'):
+        self.label = label
+        self.closed = False
+    
+    def close(self):
+        self.closed = True
+
+def test_get_or_create_prefers_registered_factory():
+    services = ServiceRegistry()
+    services.register('generator:Service', lambda: Service('registered'))
+    
+    assert services.get_or_create('generator:Service', Service).label == 'registered'
+    assert services.get('generator:Service') is services.get_or_create('generator:Service', Service)
+
+def test_get_or_create_uses_fallback_without_registration():
+    services = ServiceRegistry()
+    
+    assert services.get_or_create('service', Service).label == 'default'
+    with pytest.raises(KeyError):
+        services.get('other')
+
+def test_register_replaces_existing_instance():
+    services = ServiceRegistry()
+    first = services.get_or_create('service', Service)
+    services.register('service', lambda: Service('override'))
+    
+    assert services.get('service') is not first
+    assert services.get('service').label == 'override'
+
+def test_content_generator_factory_honours_registered_generator(monkeypatch):
+    from app.ai import content_generator
+    services = ServiceRegistry()
+    monkeypatch.setattr(content_generator, 'registry', services)
+    stub = Service('stub')
+    services.register('generator:ReviewGenerator', lambda: stub)
+    
+    assert content_generator.ContentGeneratorFactory.get_generator('feedback') is stub
+
+def test_shutdown_closes_instances():
+    services = ServiceRegistry()
+    service = services.get_or_create('service', Service)
+    services.shutdown()
+    
+    assert service.closed
+    assert services.get_or_create('service', Service) is not service
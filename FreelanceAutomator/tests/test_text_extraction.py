@@ -0,0 +1,48 @@
+import pytest
+from app.utils.text_extraction import (
+    CachedTextExtractor,
+    StreamingTextExtractor,
+    available_extractors,
+    create_text_extractor
+)
+
+SAMPLES = [
+    '<p>Need a <b>React</b> developer</p><ul><li>Hooks</li><li>Redux</li></ul>',
+    '<div>Budget: $500 &amp; bonus&nbsp;included</div>',
+    '<p>Intro</p><script>var x = "<p>hidden</p>";</script><style>p { color: red; }</style><p>Outro</p>',
+    'Plain text summary without markup',
+    '<br/>',
+    'Text before <em>tag</em> and after'
+]
+
+@pytest.fixture
+def lxml_extractor():
+    pytest.importorskip('lxml')
+    return available_extractors()['lxml']
+
+@pytest.mark.parametrize('html', SAMPLES)
+def test_lxml_matches_streaming_extractor(lxml_extractor, html):
+    assert lxml_extractor(html) == StreamingTextExtractor()(html)
+
+def test_lxml_strips_script_and_style(lxml_extractor):
+    text = lxml_extractor(SAMPLES[2])
+    
+    assert 'hidden' not in text
+    assert 'color' not in text
+    assert 'Intro' in text and 'Outro' in text
+
+def test_lxml_handles_empty_input(lxml_extractor):
+    assert lxml_extractor('') == ''
+    assert lxml_extractor('<p></p>') == ''
+
+def test_create_text_extractor_prefers_lxml(lxml_extractor):
+    assert create_text_extractor('auto', cache_size=0).name == 'lxml'
+    
+    cached = create_text_extractor('lxml', cache_size=8)
+    assert isinstance(cached, CachedTextExtractor)
+    assert cached.name == 'lxml+cache'
+    assert cached(SAMPLES[0]) == cached(SAMPLES[0])
+    assert (cached.hits, cached.misses) == (1, 1)
+
+def test_unknown_extractor_falls_back_to_streaming():
+    assert create_text_extractor('missing', cache_size=0).name == 'stream'